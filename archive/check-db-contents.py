@@ -1,51 +1,68 @@
-from pymilvus import connections, Collection, utility
+from pymilvus import utility
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import sys
 
+from milvus_conn import get_alias, ensure_loaded, get_collection
+
 def connect_to_milvus():
+    """Return the shared connection alias, or None if Milvus is unreachable"""
     try:
-        connections.connect('default', host='milvus', port='19530')
+        alias = get_alias('milvus', 19530)
         print("Connected to Milvus")
-        return True
+        return alias
     except Exception as e:
         print("Failed to connect to Milvus:", e)
-        return False
+        return None
 
-def get_collection_details(collection_name):
+def get_collection_details(collection_name, using='default'):
+    """Return (schema field names, entity count); both are metadata calls that don't need load()"""
     try:
-        collection = Collection(collection_name)
-        collection.load()
-        print(f"  Schema fields: {[field.name for field in collection.schema.fields]}")
-        return collection.num_entities
+        collection = get_collection(collection_name, using=using)
+        return [field.name for field in collection.schema.fields], collection.num_entities
     except Exception as e:
         print(f"Error checking {collection_name}: {e}")
-        return -1
+        return None, -1
+
+def sample_documents(collection, limit=5):
+    """Fetch the first few documents without a full "pk > 0" filter scan"""
+    output_fields = ["source", "text"]
+    if hasattr(collection, 'query_iterator'):
+        iterator = collection.query_iterator(batch_size=limit, limit=limit, output_fields=output_fields)
+        try:
+            return iterator.next()
+        finally:
+            iterator.close()
+    # Older pymilvus: an empty expression with a limit is a bounded scan
+    return collection.query(expr="", output_fields=output_fields, limit=limit)
 
 def main():
     print("Connecting to Milvus...")
-    if not connect_to_milvus():
+    alias = connect_to_milvus()
+    if alias is None:
         sys.exit(1)
     print("Connected successfully!")
 
     print("Listing all collections...")
-    collections = utility.list_collections()
+    collections = utility.list_collections(using=alias)
     print(f"Found {len(collections)} collections: {collections}")
 
-    for col_name in collections:
+    # Fetch metadata for all collections concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(collections)))) as executor:
+        details = list(executor.map(partial(get_collection_details, using=alias), collections))
+
+    for col_name, (field_names, num_entities) in zip(collections, details):
         print(f"\n{col_name}:")
-        num_entities = get_collection_details(col_name)
         if num_entities != -1:
+            print(f"  Schema fields: {field_names}")
             print(f"  {num_entities} entities")
             # Get sample documents to see what they contain
             if col_name == 'hammerspace_docs':
                 try:
-                    collection = Collection(col_name)
-                    collection.load()
+                    collection = get_collection(col_name, using=alias)
+                    ensure_loaded(collection, using=alias)
                     # Query first 5 documents to see their content
-                    res = collection.query(
-                        expr="pk > 0", 
-                        output_fields=["pk", "source", "text"], 
-                        limit=5
-                    )
+                    res = sample_documents(collection, limit=5)
                     print("  Sample documents:")
                     for i, doc in enumerate(res):
                         print(f"    Doc {i+1}: source='{doc['source']}' text_preview='{doc['text'][:100]}...'")
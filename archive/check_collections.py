@@ -1,21 +1,27 @@
 #!/usr/bin/env python3
 
-from pymilvus import connections, utility, Collection
+from pymilvus import utility
+
+from milvus_conn import get_alias, ensure_loaded, get_collection
 
 print('Connecting to Milvus...')
-connections.connect('default', host='milvus', port='19530')
+alias = get_alias('milvus', 19530)
 print('Connected successfully!')
 
 print('Listing collections...')
-collections = utility.list_collections()
+collections = utility.list_collections(using=alias)
 print('Found', len(collections), 'collections:')
 for col in collections:
     print('  -', col)
+# Hashed membership for the lookups below; the list keeps server order for display
+collection_names = set(collections)
 
 print('Checking hammerspace_docs collection...')
-if 'hammerspace_docs' in collections:
-    collection = Collection('hammerspace_docs')
-    print('hammerspace_docs exists with', collection.num_entities, 'entities')
+if 'hammerspace_docs' in collection_names:
+    collection = get_collection('hammerspace_docs', using=alias)
+    # num_entities is a statistics RPC, not a cached attribute; read it once
+    num_entities = collection.num_entities
+    print('hammerspace_docs exists with', num_entities, 'entities')
     
     # Check if collection is loaded
     if collection.has_index():
@@ -25,9 +31,9 @@ if 'hammerspace_docs' in collections:
         
     # Try to load the collection
     try:
-        collection.load()
+        ensure_loaded(collection, using=alias)
         print('Collection loaded successfully')
-        print('Collection now has', collection.num_entities, 'entities')
+        print('Load state:', utility.load_state('hammerspace_docs', using=alias))
     except Exception as e:
         print('Error loading collection:', e)
 else:
@@ -3,10 +3,17 @@
 import sys
 import subprocess
 
-# Install pymilvus
-subprocess.check_call([sys.executable, "-m", "pip", "install", "pymilvus"])
+# Install pymilvus only if it isn't already available
+try:
+    import pymilvus  # noqa: F401
+except ImportError:
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet",
+                           "--disable-pip-version-check", "pymilvus"])
 
-from pymilvus import connections, utility, Collection
+from pymilvus import utility
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from milvus_conn import get_alias, get_collection
 
 print("=== Checking Milvus Collections ===")
 
@@ -17,30 +24,38 @@ milvus_services = [
     ("milvus-standalone", "milvus-standalone", 19530),
 ]
 
-for service_name, host, port in milvus_services:
-    print(f"\n--- Checking {service_name} ---")
+def probe(service_name, host, port):
+    """Check one Milvus service on its own (host, port) alias; returns the report lines"""
+    lines = [f"\n--- Checking {service_name} ---"]
     try:
-        connections.connect('default', host=host, port=port)
-        print(f"Connected to {service_name}")
+        alias = get_alias(host, port, timeout=3)
+        lines.append(f"Connected to {service_name}")
         
-        collections = utility.list_collections()
-        print(f"Collections in {service_name}: {collections}")
+        collections = utility.list_collections(using=alias)
+        lines.append(f"Collections in {service_name}: {collections}")
         
-        if 'hammerspace_docs' in collections:
-            collection = Collection('hammerspace_docs')
-            print(f"hammerspace_docs exists with {collection.num_entities} entities")
+        collection_names = set(collections)
+        if 'hammerspace_docs' in collection_names:
+            collection = get_collection('hammerspace_docs', using=alias)
+            lines.append(f"hammerspace_docs exists with {collection.num_entities} entities")
             
             # Check schema
-            schema = collection.schema
-            print("Schema:")
-            for field in schema.fields:
-                print(f"  - {field.name}: {field.dtype}")
+            lines.append("Schema:")
+            for field in collection.schema.fields:
+                lines.append(f"  - {field.name}: {field.dtype}")
                 if hasattr(field, 'params') and 'dim' in field.params:
-                    print(f"    dim: {field.params['dim']}")
+                    lines.append(f"    dim: {field.params['dim']}")
         else:
-            print("hammerspace_docs collection not found")
+            lines.append("hammerspace_docs collection not found")
             
     except Exception as e:
-        print(f"Failed to connect to {service_name}: {e}")
+        lines.append(f"Failed to connect to {service_name}: {e}")
+    return lines
+
+# Probe all services in parallel so unreachable hosts don't stack connect timeouts
+with ThreadPoolExecutor(max_workers=len(milvus_services)) as executor:
+    futures = [executor.submit(probe, *service) for service in milvus_services]
+    for future in as_completed(futures):
+        print("\n".join(future.result()))
 
 print("\n=== Check Complete ===")
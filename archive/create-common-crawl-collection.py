@@ -55,11 +55,7 @@ def extract_text_from_pdf(pdf_path):
         print("Error extracting text from", pdf_path, ":", e)
         return None
 
-def generate_simple_embedding(text):
-    # In a real scenario, this would call an embedding model
-    return np.random.rand(2048).tolist()
-
-def ingest_pdf(pdf_path, collection):
+def ingest_pdf(pdf_path, collection, embedding_row):
     filename = os.path.basename(pdf_path)
     print("Processing:", filename)
     
@@ -70,10 +66,11 @@ def ingest_pdf(pdf_path, collection):
     
     # Truncate text to fit Milvus VARCHAR max_length (leaving buffer)
     text = text[:3950]
-    embedding = generate_simple_embedding(text)
     
+    # embedding_row is a float32 view into the batch generated in main();
+    # pymilvus takes the ndarray directly, no per-element Python floats
     data = [
-        [embedding],
+        [embedding_row],
         [filename],
         [text]
     ]
@@ -104,12 +101,17 @@ def main():
     pdf_files = [f for f in os.listdir(pdf_dir) if f.endswith('.pdf')]
     print(f"Found {len(pdf_files)} HammerSpace PDF files in {pdf_dir}")
     
+    # In a real scenario, this would call an embedding model; generate the
+    # random placeholder vectors for every file in one call
+    rng = np.random.default_rng()
+    embeddings = rng.random((len(pdf_files), 2048), dtype=np.float32)
+    
     processed = 0
     successful = 0
     
-    for pdf_file in pdf_files:
+    for i, pdf_file in enumerate(pdf_files):
         pdf_path = os.path.join(pdf_dir, pdf_file)
-        if ingest_pdf(pdf_path, collection):
+        if ingest_pdf(pdf_path, collection, embeddings[i]):
             successful += 1
         processed += 1
     
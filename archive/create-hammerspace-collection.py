@@ -29,9 +29,11 @@ collection = Collection(name=collection_name, schema=schema)
 print(f'Created collection: {collection_name}')
 
 # Create index on the vector field
+# IVF_SQ8 stores the index as int8 codes (4x smaller than float32); the raw
+# vectors stay FLOAT_VECTOR so the RAG server and client-side rerank still see full precision
 index_params = {
     "metric_type": "L2",
-    "index_type": "IVF_FLAT",
+    "index_type": "IVF_SQ8",
     "params": {"nlist": 128}
 }
 collection.create_index(field_name="vector", index_params=index_params)
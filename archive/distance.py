@@ -0,0 +1,157 @@
+"""
+Client-side distance kernels for the RAG Playground
+Provides embedding normalization/quantization, short-circuit L2 top-k
+rescoring and SIMD similarity helpers for vectors exchanged with Milvus
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+# Numba is optional; without it we fall back to a vectorized NumPy scan
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    logging.warning("Numba not available. Install with: pip install numba")
+
+# SimSIMD is optional; without it similarity helpers use NumPy
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+    logging.warning("SimSIMD not available. Install with: pip install simsimd")
+
+# Number of dimensions summed between early-abort checks
+BLOCK_SIZE = 16
+
+
+def _l2_topk_kernel(query, candidates, k):
+    """Blocked L2 top-k that abandons a candidate once it exceeds the k-th best distance"""
+    n, dim = candidates.shape
+    best_distances = np.full(k, np.inf, dtype=np.float32)
+    best_indices = np.full(k, -1, dtype=np.int64)
+    worst = 0
+
+    for i in range(n):
+        threshold = best_distances[worst]
+        partial = 0.0
+        aborted = False
+        for start in range(0, dim, BLOCK_SIZE):
+            stop = min(start + BLOCK_SIZE, dim)
+            for j in range(start, stop):
+                diff = candidates[i, j] - query[j]
+                partial += diff * diff
+            # Partial sums only grow, so this is already a lower bound
+            if partial >= threshold:
+                aborted = True
+                break
+        if aborted:
+            continue
+
+        best_distances[worst] = partial
+        best_indices[worst] = i
+        worst = np.argmax(best_distances)
+
+    order = np.argsort(best_distances)
+    return best_indices[order], best_distances[order]
+
+
+if NUMBA_AVAILABLE:
+    _l2_topk_kernel = njit(cache=True, fastmath=True)(_l2_topk_kernel)
+
+
+def l2_topk(query, candidates, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (indices, squared L2 distances) of the k candidates closest to query,
+    ordered nearest first.
+    """
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    candidates = np.ascontiguousarray(candidates, dtype=np.float32)
+    k = min(k, len(candidates))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    if NUMBA_AVAILABLE:
+        return _l2_topk_kernel(query, candidates, k)
+
+    distances = np.square(candidates - query).sum(axis=1)
+    indices = np.argpartition(distances, k - 1)[:k]
+    indices = indices[np.argsort(distances[indices])]
+    return indices, distances[indices]
+
+
+def cosine_distance(a, b) -> float:
+    """Cosine distance (1 - cosine similarity) between two vectors of the same dtype"""
+    if SIMSIMD_AVAILABLE:
+        return float(simsimd.cosine(a, b))
+
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    denom = np.linalg.norm(a) * np.linalg.norm(b)
+    if denom == 0:
+        return 1.0
+    return float(1.0 - np.dot(a, b) / denom)
+
+
+def dedupe_indices(vectors, threshold: float = 0.02):
+    """
+    Return indices of vectors to keep, dropping any vector whose cosine
+    distance to an already kept vector is below threshold.
+    """
+    kept = []
+    for i, vector in enumerate(vectors):
+        if all(cosine_distance(vector, vectors[j]) >= threshold for j in kept):
+            kept.append(i)
+    return kept
+
+
+def _normalize_kernel(batch, out, quantize):
+    """Single-pass L2 normalization of each row into out, optionally quantized to int8"""
+    n, dim = batch.shape
+    for i in prange(n):
+        total = 0.0
+        for j in range(dim):
+            total += batch[i, j] * batch[i, j]
+        inv = 1.0 / np.sqrt(total) if total > 0 else 0.0
+        for j in range(dim):
+            value = batch[i, j] * inv
+            if quantize:
+                out[i, j] = min(max(round(value * 127.0), -128), 127)
+            else:
+                out[i, j] = value
+
+
+if NUMBA_AVAILABLE:
+    _normalize_kernel = njit(parallel=True, fastmath=True, cache=True)(_normalize_kernel)
+
+
+def _normalize_numpy(batch, out, quantize):
+    norms = np.linalg.norm(batch, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized = batch / norms
+    if quantize:
+        np.clip(np.rint(normalized * 127.0), -128, 127, out=normalized)
+    out[...] = normalized
+
+
+def normalize_embeddings(batch, dtype=np.float32) -> np.ndarray:
+    """
+    L2-normalize a (B, D) batch of embeddings (or a single D vector) in one pass.
+    With dtype=np.int8 the normalized values are also scaled by 127 and quantized.
+    """
+    batch = np.asarray(batch, dtype=np.float32)
+    single = batch.ndim == 1
+    batch = np.ascontiguousarray(batch.reshape(1, -1) if single else batch)
+    out = np.empty(batch.shape, dtype=dtype)
+    quantize = bool(out.dtype == np.int8)
+
+    if NUMBA_AVAILABLE:
+        _normalize_kernel(batch, out, quantize)
+    else:
+        _normalize_numpy(batch, out, quantize)
+    return out[0] if single else out
@@ -0,0 +1,21 @@
+"""
+Shared requests session factory for the archive scripts
+Each script builds one keep-alive Session up front, with the connection pool
+sized to how many requests it actually has in flight at once
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session(pool_maxsize: int = 1, retries: int = 2) -> requests.Session:
+    """Return a Session whose pool holds pool_maxsize connections per host, retrying failed connects"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=0.2) if retries else 0
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
@@ -37,7 +37,7 @@ def ensure_collection():
     
     index_params = {
         'metric_type': 'L2',
-        'index_type': 'IVF_FLAT',
+        'index_type': 'IVF_SQ8',
         'params': {'nlist': 128}
     }
     collection.create_index(field_name='vector', index_params=index_params)
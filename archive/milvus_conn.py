@@ -0,0 +1,38 @@
+"""
+Shared Milvus connection helpers for the archive check scripts
+Keeps one pymilvus alias per (host, port) so scripts running in the same
+process reuse a single gRPC channel instead of re-connecting 'default',
+plus cached Collection handles and a load-if-needed helper
+"""
+
+from functools import lru_cache
+
+from pymilvus import Collection, connections, utility
+from pymilvus.client.types import LoadState
+
+# Collection() issues a DescribeCollection RPC, so keep one handle per (alias, name)
+_collection_cache = {}
+
+
+@lru_cache(maxsize=None)
+def get_alias(host: str = 'milvus', port: int = 19530, timeout: float = None) -> str:
+    """Connect to host:port once and return the alias to pass as using="""
+    alias = f"{host}:{port}"
+    if not connections.has_connection(alias):
+        kwargs = {} if timeout is None else {'timeout': timeout}
+        connections.connect(alias=alias, host=host, port=port, **kwargs)
+    return alias
+
+
+def get_collection(name: str, using: str = 'default') -> Collection:
+    """Return a cached Collection handle"""
+    key = (using, name)
+    if key not in _collection_cache:
+        _collection_cache[key] = Collection(name, using=using)
+    return _collection_cache[key]
+
+
+def ensure_loaded(collection: Collection, using: str = 'default'):
+    """Load the collection unless Milvus already reports it as loaded"""
+    if utility.load_state(collection.name, using=using) != LoadState.Loaded:
+        collection.load()
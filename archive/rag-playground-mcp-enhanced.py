@@ -3,20 +3,87 @@ Enhanced RAG Playground with MCP Client Integration
 Provides document search capabilities with MCP server integration
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 import json
 import asyncio
 import logging
+import hashlib
+import threading
+import time
+from collections import namedtuple, OrderedDict
 from pymilvus import connections, Collection
 import numpy as np
 import requests
 from mcp_client import mcp_manager, MCP_AVAILABLE
+from distance import l2_topk, dedupe_indices, normalize_embeddings
+
+# orjson is optional; Flask's stdlib JSON provider is used without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (also serializes numpy scalars/arrays)"""
+    
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+
+# Hit shape returned after client-side rescoring (mirrors pymilvus Hit)
+RerankedHit = namedtuple('RerankedHit', ['id', 'entity', 'distance'])
+
+# Exact-match cache for /search responses: key -> (timestamp, results)
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_MAX_ENTRIES = 1024
+search_cache = OrderedDict()
+# Flask serves requests on multiple threads; guards every read-modify-write of search_cache
+search_cache_lock = threading.Lock()
+
+def search_cache_key(query, top_k, rerank_factor, dedup):
+    """Build a cache key from the normalized query and search options"""
+    raw = f"{query.lower().strip()}|{top_k}|{rerank_factor}|{dedup}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def get_cached_search(key):
+    """Return cached results for key, or None if missing or expired"""
+    with search_cache_lock:
+        entry = search_cache.get(key)
+        if entry is None:
+            return None
+        timestamp, results = entry
+        if time.time() - timestamp > SEARCH_CACHE_TTL:
+            search_cache.pop(key, None)
+            return None
+        search_cache.move_to_end(key)
+        return results
+
+def put_cached_search(key, results):
+    """Store results for key, evicting the least recently used entry when full"""
+    with search_cache_lock:
+        search_cache[key] = (time.time(), results)
+        search_cache.move_to_end(key)
+        while len(search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            search_cache.popitem(last=False)
 
 def connect_to_milvus():
     """Connect to Milvus and return the collection"""
@@ -29,35 +96,68 @@ def connect_to_milvus():
         logger.error(f"Error connecting to Milvus: {e}")
         return None
 
-def simple_search(collection, query, top_k=5):
-    """Perform a simple vector search"""
+def simple_search(collection, query, top_k=5, rerank_factor=1, dedup=False):
+    """Perform a simple vector search, optionally rescoring an oversampled candidate set"""
     try:
-        # Generate a simple embedding for the query
-        query_embedding = np.random.rand(2048).tolist()
+        # Generate a simple embedding for the query (normalized like a real embedder's output)
+        query_embedding = normalize_embeddings(np.random.rand(2048))
+        rerank = rerank_factor > 1
+        need_vectors = rerank or dedup
         
         # Search for similar documents
         search_params = {"metric_type": "L2", "params": {"nprobe": 10}}
         results = collection.search(
-            data=[query_embedding],
+            data=[query_embedding.tolist()],
             anns_field="vector",
             param=search_params,
-            limit=top_k,
-            output_fields=["source", "text"]
+            limit=top_k * rerank_factor if rerank else top_k,
+            output_fields=["source", "text", "vector"] if need_vectors else ["source", "text"]
         )
         
-        return results[0] if results else []
+        hits = results[0] if results else []
+        if need_vectors and hits:
+            hits = list(hits)
+            candidates = np.asarray([hit.entity.get('vector') for hit in hits], dtype=np.float32)
+            if dedup:
+                kept = dedupe_indices(candidates)
+                hits = [hits[i] for i in kept]
+                candidates = candidates[kept]
+            if rerank:
+                hits = rerank_hits(query_embedding, hits, candidates, top_k)
+        return hits
     except Exception as e:
+        # Re-raise so /search answers with an error rather than caching an empty result
         logger.error(f"Search error: {e}")
-        return []
+        raise
 
-def run_async(coro):
-    """Run an async coroutine in a new event loop"""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+def rerank_hits(query_embedding, hits, candidates, top_k):
+    """Rescore candidate hits with exact L2 distance and keep the top_k"""
+    indices, distances = l2_topk(query_embedding, candidates, top_k)
+    return [RerankedHit(hits[i].id, hits[i].entity, float(d)) for i, d in zip(indices, distances)]
+
+# Long-lived event loop for MCP calls. MCP sessions are bound to the loop that
+# opened them, and concurrent Flask requests can all submit to the same loop.
+mcp_loop = asyncio.new_event_loop()
+threading.Thread(target=mcp_loop.run_forever, name="mcp-event-loop", daemon=True).start()
+
+def run_async(coro, timeout=None):
+    """Run an async coroutine on the shared MCP event loop and wait for the result"""
+    return asyncio.run_coroutine_threadsafe(coro, mcp_loop).result(timeout)
+
+# Dashboard polls /mcp/status and /mcp/servers; reuse the server snapshot briefly
+SERVERS_INFO_TTL = 10
+servers_info_cache = {'value': None, 'timestamp': 0.0}
+
+def get_servers_info():
+    """Return mcp_manager.get_all_servers_info(), cached for SERVERS_INFO_TTL seconds"""
+    if servers_info_cache['value'] is None or time.time() - servers_info_cache['timestamp'] > SERVERS_INFO_TTL:
+        servers_info_cache['value'] = mcp_manager.get_all_servers_info()
+        servers_info_cache['timestamp'] = time.time()
+    return servers_info_cache['value']
+
+def invalidate_servers_info():
+    """Drop the cached server snapshot after a connection change"""
+    servers_info_cache['value'] = None
 
 # MCP Client Routes
 @app.route('/mcp/status')
@@ -66,7 +166,7 @@ def mcp_status():
     try:
         status = mcp_manager.get_connection_status()
         connected_servers = mcp_manager.get_connected_servers()
-        servers_info = mcp_manager.get_all_servers_info()
+        servers_info = get_servers_info()
         
         return jsonify({
             "status": "success",
@@ -93,6 +193,7 @@ def mcp_connect():
         success = run_async(mcp_manager.connect_to_server(server_name))
         
         if success:
+            invalidate_servers_info()
             return jsonify({
                 "status": "success",
                 "message": f"Connected to {server_name}",
@@ -119,6 +220,7 @@ def mcp_disconnect():
         success = run_async(mcp_manager.disconnect_server(server_name))
         
         if success:
+            invalidate_servers_info()
             return jsonify({
                 "status": "success",
                 "message": f"Disconnected from {server_name}",
@@ -184,7 +286,7 @@ def mcp_call():
 def mcp_servers():
     """Get information about all MCP servers"""
     try:
-        servers_info = mcp_manager.get_all_servers_info()
+        servers_info = get_servers_info()
         return jsonify({
             "status": "success",
             "servers": servers_info
@@ -194,10 +296,17 @@ def mcp_servers():
         return jsonify({"error": str(e)}), 500
 
 # Original RAG Playground Routes
+# Compiled once on first request; render_template_string recompiles every hit
+index_template = None
+
 @app.route('/')
 def index():
     """Main playground interface"""
-    return render_template_string('''
+    global index_template
+    if index_template is not None:
+        return index_template.render()
+    
+    index_template = app.jinja_env.from_string('''
     <!DOCTYPE html>
     <html>
     <head>
@@ -570,20 +679,34 @@ def index():
     </body>
     </html>
     ''')
+    return index_template.render()
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
     return jsonify({"status": "healthy"})
 
+# num_entities is a coordinator RPC; the dashboard polls /stats, so cache it briefly
+STATS_CACHE_TTL = 30
+stats_cache = {'total_documents': 0, 'timestamp': 0.0}
+
 @app.route('/stats')
 def stats():
     """Get document statistics"""
     try:
+        if time.time() - stats_cache['timestamp'] < STATS_CACHE_TTL:
+            return jsonify({
+                "total_documents": stats_cache['total_documents'],
+                "collection_name": "hammerspace_docs",
+                "status": "connected"
+            })
+        
         collection = connect_to_milvus()
         if collection:
+            stats_cache['total_documents'] = collection.num_entities
+            stats_cache['timestamp'] = time.time()
             return jsonify({
-                "total_documents": collection.num_entities,
+                "total_documents": stats_cache['total_documents'],
                 "collection_name": "hammerspace_docs",
                 "status": "connected"
             })
@@ -600,21 +723,33 @@ def search():
         data = request.get_json()
         query = data.get('query', '')
         top_k = data.get('top_k', 5)
+        rerank_factor = data.get('rerank_factor', 1)
+        dedup = data.get('dedup', False)
+        
+        cache_key = search_cache_key(query, top_k, rerank_factor, dedup)
+        cached = get_cached_search(cache_key)
+        if cached is not None:
+            return jsonify({"results": cached, "query": query, "cached": True})
         
         collection = connect_to_milvus()
         if not collection:
             return jsonify({"error": "Cannot connect to Milvus"}), 500
         
-        results = simple_search(collection, query, top_k)
+        results = simple_search(collection, query, top_k, rerank_factor, dedup)
         
-        formatted_results = []
-        for result in results:
-            formatted_results.append({
-                "source": result.entity.get('source', 'Unknown'),
-                "text": result.entity.get('text', 'No text available'),
+        formatted_results = [
+            {
+                # Chunk primary key, so downstream prefix/KV caches can key on the chunk
+                "id": result.id,
+                "source": entity.get('source', 'Unknown'),
+                "text": entity.get('text', 'No text available'),
                 "distance": result.distance
-            })
+            }
+            for result in results
+            for entity in (result.entity,)
+        ]
         
+        put_cached_search(cache_key, formatted_results)
         return jsonify({"results": formatted_results, "query": query})
     except Exception as e:
         logger.error(f"Search error: {e}")
@@ -1,10 +1,33 @@
 #!/usr/bin/env python3
 
-import requests
+from http_session import make_session
 import os
 import time
 from pathlib import Path
 
+# Streaming multipart encoder (optional); falls back to buffered requests upload
+try:
+    from requests_toolbelt import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+# Shared session so health check, collection creation and upload reuse one connection
+SESSION = make_session(retries=3)
+
+def upload_pdf(rag_url, pdf_file, form_data, timeout=60):
+    """Upload a PDF, streaming the file body instead of buffering it in memory"""
+    with open(pdf_file, 'rb') as f:
+        if TOOLBELT_AVAILABLE:
+            fields = {key: str(value) for key, value in form_data.items()}
+            fields['file'] = (pdf_file.name, f, 'application/pdf')
+            encoder = MultipartEncoder(fields=fields)
+            return SESSION.post(f"{rag_url}/upload", data=encoder,
+                                headers={'Content-Type': encoder.content_type}, timeout=timeout)
+        
+        files = {'file': (pdf_file.name, f, 'application/pdf')}
+        return SESSION.post(f"{rag_url}/upload", files=files, data=form_data, timeout=timeout)
+
 def ingest_pdf_simple():
     """Simple PDF ingestion using RAG Blueprint API"""
     
@@ -30,7 +53,7 @@ def ingest_pdf_simple():
     
     # Test RAG server connection
     try:
-        response = requests.get(f"{RAG_URL}/health", timeout=5)
+        response = SESSION.get(f"{RAG_URL}/health", timeout=5)
         print(f"✅ RAG server health: {response.status_code}")
     except Exception as e:
         print(f"❌ RAG server connection failed: {e}")
@@ -45,7 +68,7 @@ def ingest_pdf_simple():
     
     try:
         print("Creating collection...")
-        response = requests.post(f"{RAG_URL}/collections", json=collection_data, timeout=10)
+        response = SESSION.post(f"{RAG_URL}/collections", json=collection_data, timeout=10)
         print(f"Collection creation: {response.status_code}")
         if response.status_code not in [200, 201]:
             print(f"Response: {response.text}")
@@ -57,25 +80,23 @@ def ingest_pdf_simple():
     print(f"Uploading PDF: {pdf_file.name}")
     
     try:
-        with open(pdf_file, 'rb') as f:
-            files = {'file': (pdf_file.name, f, 'application/pdf')}
-            data = {
-                'collection_name': 'test_documents',
-                'chunk_size': 512,
-                'chunk_overlap': 50
-            }
-            
-            response = requests.post(f"{RAG_URL}/upload", files=files, data=data, timeout=60)
-            print(f"PDF upload: {response.status_code}")
-            print(f"Response: {response.text}")
+        data = {
+            'collection_name': 'test_documents',
+            'chunk_size': 512,
+            'chunk_overlap': 50
+        }
+        
+        response = upload_pdf(RAG_URL, pdf_file, data)
+        print(f"PDF upload: {response.status_code}")
+        print(f"Response: {response.text}")
+        
+        if response.status_code == 200:
+            print("✅ PDF ingestion successful!")
+            return True
+        else:
+            print("❌ PDF ingestion failed")
+            return False
             
-            if response.status_code == 200:
-                print("✅ PDF ingestion successful!")
-                return True
-            else:
-                print("❌ PDF ingestion failed")
-                return False
-                
     except Exception as e:
         print(f"❌ PDF upload error: {e}")
         return False
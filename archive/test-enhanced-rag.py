@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 
-import requests
+from http_session import make_session
 import json
 
 RAG_URL = "http://rag-server-mcp-enhanced:8081"
+
+# Shared session so all three checks reuse one keep-alive connection
+SESSION = make_session(retries=3)
+
 print("Testing Enhanced RAG Server with MCP...")
 
 # Test health endpoint
 try:
-    response = requests.get(f"{RAG_URL}/health", timeout=10)
+    response = SESSION.get(f"{RAG_URL}/health", timeout=10)
     print(f"Health: {response.status_code}")
     if response.status_code == 200:
         health = response.json()
@@ -21,7 +25,7 @@ except Exception as e:
 
 # Test MCP status endpoint
 try:
-    response = requests.get(f"{RAG_URL}/mcp/status", timeout=10)
+    response = SESSION.get(f"{RAG_URL}/mcp/status", timeout=10)
     print(f"MCP Status: {response.status_code}")
     if response.status_code == 200:
         mcp_status = response.json()
@@ -36,7 +40,7 @@ try:
         "collection_names": ["hammerspace_docs"],
         "vdb_top_k": 3
     }
-    response = requests.post(f"{RAG_URL}/search", json=search_payload, timeout=30)
+    response = SESSION.post(f"{RAG_URL}/search", json=search_payload, timeout=30)
     print(f"Search: {response.status_code}")
     if response.status_code == 200:
         search_result = response.json()
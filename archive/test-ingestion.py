@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
-import requests
+from http_session import make_session
 import json
 import os
-import time
+
+# Streaming multipart encoder (optional); falls back to buffered requests upload
+try:
+    from requests_toolbelt import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+# Health, collections and upload calls all hit the ingestor; keep one connection open
+session = make_session()
 
 def test_ingestion_pipeline():
     print("=== TESTING INGESTION PIPELINE ===")
@@ -18,10 +27,9 @@ def test_ingestion_pipeline():
     test_pdf = os.path.join(pdf_dir, test_pdfs[0])
     print(f"📄 Testing with: {test_pdfs[0]}")
     
-    # Test 1: Check if we can read the file
+    # Test 1: Check the file exists and get its size without reading it
     try:
-        with open(test_pdf, 'rb') as f:
-            file_size = len(f.read())
+        file_size = os.path.getsize(test_pdf)
         print(f"✅ File readable, size: {file_size} bytes")
     except Exception as e:
         print(f"❌ Cannot read file: {e}")
@@ -31,15 +39,27 @@ def test_ingestion_pipeline():
     print("\n🔧 Testing Ingestor Server API...")
     try:
         with open(test_pdf, 'rb') as f:
-            files = {'files': (test_pdfs[0], f, 'application/pdf')}
-            data = {'collection_name': 'test_collection'}
-            
-            response = requests.post(
-                'http://ingestor-server:8082/documents',
-                files=files,
-                data=data,
-                timeout=120
-            )
+            if TOOLBELT_AVAILABLE:
+                encoder = MultipartEncoder(fields={
+                    'files': (test_pdfs[0], f, 'application/pdf'),
+                    'collection_name': 'test_collection'
+                })
+                response = session.post(
+                    'http://ingestor-server:8082/documents',
+                    data=encoder,
+                    headers={'Content-Type': encoder.content_type},
+                    timeout=120
+                )
+            else:
+                files = {'files': (test_pdfs[0], f, 'application/pdf')}
+                data = {'collection_name': 'test_collection'}
+                
+                response = session.post(
+                    'http://ingestor-server:8082/documents',
+                    files=files,
+                    data=data,
+                    timeout=120
+                )
             
             print(f"   Status: {response.status_code}")
             print(f"   Response: {response.text[:500]}")
@@ -55,7 +75,7 @@ def test_ingestion_pipeline():
     # Test 3: Check collections
     print("\n📊 Checking collections...")
     try:
-        response = requests.get('http://ingestor-server:8082/collections', timeout=30)
+        response = session.get('http://ingestor-server:8082/collections', timeout=30)
         if response.status_code == 200:
             collections = response.json()
             print(f"✅ Collections: {collections}")
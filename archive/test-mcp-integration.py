@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 
-import requests
+from http_session import make_session
 import json
 
+# /stats and /search go to the same playground service
+session = make_session()
+
 PLAYGROUND_URL = "http://rag-playground-registry-service:8080"
 print("Testing Enhanced RAG Playground with MCP Integration...")
 
 # Test stats endpoint
 try:
-    response = requests.get(f"{PLAYGROUND_URL}/stats", timeout=10)
+    response = session.get(f"{PLAYGROUND_URL}/stats", timeout=10)
     print(f"Stats: {response.status_code}")
     if response.status_code == 200:
         stats = response.json()
@@ -21,7 +24,7 @@ except Exception as e:
 # Test search endpoint
 try:
     search_payload = {"query": "HammerSpace", "top_k": 2}
-    response = requests.post(f"{PLAYGROUND_URL}/search", json=search_payload, timeout=30)
+    response = session.post(f"{PLAYGROUND_URL}/search", json=search_payload, timeout=30)
     print(f"Search: {response.status_code}")
     if response.status_code == 200:
         result = response.json()
@@ -1,4 +1,5 @@
-from pymilvus import connections, utility
+from pymilvus import connections, utility, Collection
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 milvus_services = [
@@ -7,26 +8,34 @@ milvus_services = [
     ('milvus-standalone-working', 19530)
 ]
 
-for service, port in milvus_services:
+def probe(index, service, port):
+    """Probe one Milvus service on its own alias and return the report lines"""
+    alias = f'probe_{index}'
+    lines = [f'Testing {service}:{port}...']
     try:
-        print(f'Testing {service}:{port}...')
-        connections.connect('default', host=service, port=port)
-        collections = utility.list_collections()
-        print(f'  Collections: {collections}')
-        
+        connections.connect(alias, host=service, port=port)
+        collections = utility.list_collections(using=alias)
+        lines.append(f'  Collections: {collections}')
+
         # Check hammerspace_docs if it exists
-        if 'hammerspace_docs' in collections:
-            from pymilvus import Collection
-            col = Collection('hammerspace_docs')
+        collection_names = set(collections)
+        if 'hammerspace_docs' in collection_names:
+            col = Collection('hammerspace_docs', using=alias)
             col.load()
-            print(f'  hammerspace_docs: {col.num_entities} entities')
-        
-        connections.disconnect('default')
-        print()
+            lines.append(f'  hammerspace_docs: {col.num_entities} entities')
     except Exception as e:
-        print(f'  Error: {e}')
+        lines.append(f'  Error: {e}')
+    finally:
         try:
-            connections.disconnect('default')
+            connections.disconnect(alias)
         except:
             pass
+    return lines
+
+# Probe all services concurrently; unreachable hosts no longer serialize on connect timeouts
+with ThreadPoolExecutor(max_workers=len(milvus_services)) as executor:
+    reports = executor.map(lambda args: probe(*args),
+                           [(i, service, port) for i, (service, port) in enumerate(milvus_services)])
+    for lines in reports:
+        print('\n'.join(lines))
         print()
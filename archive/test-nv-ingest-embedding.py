@@ -2,10 +2,16 @@
 
 import subprocess
 import sys
-subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
 
-import requests
+# Only pay for pip when requests is actually missing
+try:
+    import requests
+except ImportError:
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", "requests"])
+    import requests
+from http_session import make_session
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 NV_INGEST_URL = 'http://nv-ingest-simple-api:8080'
 
@@ -14,20 +20,35 @@ print('=== Testing nv-ingest for Embedding Functionality ===')
 # Test if nv-ingest has embedding endpoints
 embedding_endpoints = ['/embed', '/embedding', '/embeddings', '/api/embed', '/api/embeddings', '/v1/embeddings']
 
-for endpoint in embedding_endpoints:
+# One pooled connection per parallel probe; no retries, so a down service
+# fails each probe after a single connect attempt
+session = make_session(pool_maxsize=len(embedding_endpoints), retries=0)
+
+def probe(endpoint):
+    """POST a test sentence to one candidate endpoint; returns (endpoint, response, error)"""
     try:
-        response = requests.post(f'{NV_INGEST_URL}{endpoint}', 
-                               json={"text": "This is a test sentence for embedding."}, 
-                               timeout=10)
-        print(f'POST {endpoint}: {response.status_code}')
-        if response.status_code in [200, 201]:
-            print(f'  Success! Response: {response.json()}')
-        elif response.status_code == 404:
-            print(f'  Not found')
-        else:
-            print(f'  Error: {response.text[:100]}...')
+        response = session.post(f'{NV_INGEST_URL}{endpoint}', 
+                                json={"text": "This is a test sentence for embedding."}, 
+                                timeout=10)
+        return endpoint, response, None
     except Exception as e:
-        print(f'POST {endpoint}: Error - {e}')
+        return endpoint, None, e
+
+# Probe all candidates at once so a down service costs one timeout, not six
+with ThreadPoolExecutor(max_workers=len(embedding_endpoints)) as executor:
+    probes = list(executor.map(probe, embedding_endpoints))
+
+for endpoint, response, error in probes:
+    if error is not None:
+        print(f'POST {endpoint}: Error - {error}')
+        continue
+    print(f'POST {endpoint}: {response.status_code}')
+    if response.status_code in [200, 201]:
+        print(f'  Success! Response: {response.json()}')
+    elif response.status_code == 404:
+        print(f'  Not found')
+    else:
+        print(f'  Error: {response.text[:100]}...')
 
 # Test if we can use the documents endpoint to get embeddings
 print("\n=== Testing Documents Endpoint for Embedding ===")
@@ -39,7 +60,7 @@ try:
     data = {
         'collection_name': 'test_embedding'
     }
-    response = requests.post(f'{NV_INGEST_URL}/documents', 
+    response = session.post(f'{NV_INGEST_URL}/documents', 
                            files=files, 
                            data=data, 
                            timeout=30)
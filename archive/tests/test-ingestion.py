@@ -3,19 +3,22 @@ import requests
 import json
 import os
 
+# Reused by every ingestor-server request below
+session = requests.Session()
+
 def test_ingestion():
     print("=== TESTING PDF INGESTION ===")
     
     # Test ingestor-server API
     try:
-        response = requests.get('http://ingestor-server:8082/health', timeout=10)
+        response = session.get('http://ingestor-server:8082/health', timeout=10)
         print(f"Health check: {response.status_code} - {response.text}")
     except Exception as e:
         print(f"Health check failed: {e}")
     
     # Test collections
     try:
-        response = requests.get('http://ingestor-server:8082/collections', timeout=10)
+        response = session.get('http://ingestor-server:8082/collections', timeout=10)
         print(f"Collections: {response.status_code} - {response.text}")
     except Exception as e:
         print(f"Collections check failed: {e}")
@@ -32,7 +35,7 @@ def test_ingestion():
             
             # Create collection first
             try:
-                response = requests.post(
+                response = session.post(
                     'http://ingestor-server:8082/collection',
                     json={'collection_name': 'test_collection'},
                     timeout=30
@@ -47,7 +50,7 @@ def test_ingestion():
                     files = {'documents': (test_pdfs[0], f, 'application/pdf')}
                     data = {'data': json.dumps({'collection_name': 'test_collection'})}
                     
-                    response = requests.post(
+                    response = session.post(
                         'http://ingestor-server:8082/documents',
                         files=files,
                         data=data,
@@ -7,8 +7,68 @@ This script connects to Milvus and drops all collections that start with "case_"
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pymilvus import connections, utility
 
+# Per-host connect timeout so unreachable hosts fail fast
+CONNECT_TIMEOUT = 3
+
+# Bounded so a large purge doesn't flood the Milvus coordinator
+DROP_WORKERS = 16
+
+def _try_connect(index, method):
+    """Connect on a per-attempt alias and return it; raises (leaving nothing connected) on failure"""
+    alias = f"try{index}"
+    try:
+        connections.connect(alias, host=method["host"], port=method["port"], timeout=CONNECT_TIMEOUT)
+    except Exception:
+        _disconnect(alias)
+        raise
+    return alias
+
+def _disconnect(alias):
+    try:
+        connections.disconnect(alias)
+    except Exception:
+        pass
+
+def _disconnect_loser(future):
+    """Close a connection that succeeded after another host already won"""
+    if not future.cancelled() and future.exception() is None:
+        _disconnect(future.result())
+
+def _connect_first_available(connection_methods):
+    """Race all connection methods and return (alias, method) for the first reachable host"""
+    executor = ThreadPoolExecutor(max_workers=len(connection_methods))
+    pending = {executor.submit(_try_connect, i, method): method
+               for i, method in enumerate(connection_methods)}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                method = pending.pop(future)
+                try:
+                    alias = future.result()
+                except Exception as e:
+                    print(f"❌ Failed to connect to {method['host']}:{method['port']} - {e}")
+                    continue
+                # The winning connection is used as is; later successes are closed
+                for other in pending:
+                    other.add_done_callback(_disconnect_loser)
+                return alias, method
+        return None, None
+    finally:
+        # Don't wait on slower attempts; their callbacks clean them up
+        executor.shutdown(wait=False)
+
+def _try_drop(collection_name, alias):
+    """Drop a collection, returning the exception on failure or None on success"""
+    try:
+        utility.drop_collection(collection_name, using=alias)
+        return None
+    except Exception as e:
+        return e
+
 def main():
     print("🗑️  Purging case collections from Milvus...")
     
@@ -20,25 +80,19 @@ def main():
         {"host": "localhost", "port": "19530"},
     ]
     
-    connected = False
-    for method in connection_methods:
-        try:
-            print(f"Trying to connect to {method['host']}:{method['port']}...")
-            connections.connect("default", host=method["host"], port=method["port"])
-            print(f"✅ Connected to Milvus at {method['host']}:{method['port']}")
-            connected = True
-            break
-        except Exception as e:
-            print(f"❌ Failed to connect to {method['host']}:{method['port']} - {e}")
-            continue
+    hosts = ", ".join(f"{m['host']}:{m['port']}" for m in connection_methods)
+    print(f"Trying to connect to {hosts} in parallel...")
+    alias, winner = _connect_first_available(connection_methods)
     
-    if not connected:
+    if winner is None:
         print("❌ Could not connect to Milvus. Please check if Milvus is running.")
         return 1
     
+    print(f"✅ Connected to Milvus at {winner['host']}:{winner['port']}")
+    
     try:
         # List all collections
-        collections = utility.list_collections()
+        collections = utility.list_collections(using=alias)
         print(f"\n📋 Found {len(collections)} collections:")
         for col in collections:
             print(f"  - {col}")
@@ -51,18 +105,19 @@ def main():
             return 0
         
         print(f"\n🗑️  Dropping {len(case_collections)} case collections:")
-        dropped_count = 0
+        with ThreadPoolExecutor(max_workers=DROP_WORKERS) as executor:
+            errors = list(executor.map(lambda col: _try_drop(col, alias), case_collections))
         
-        for col in case_collections:
-            try:
-                utility.drop_collection(col)
+        dropped_count = 0
+        for col, error in zip(case_collections, errors):
+            if error is None:
                 print(f"  ✅ Dropped: {col}")
                 dropped_count += 1
-            except Exception as e:
-                print(f"  ❌ Failed to drop {col}: {e}")
+            else:
+                print(f"  ❌ Failed to drop {col}: {error}")
         
         # List remaining collections
-        remaining = utility.list_collections()
+        remaining = utility.list_collections(using=alias)
         print(f"\n📋 Remaining collections ({len(remaining)}):")
         for col in remaining:
             print(f"  - {col}")
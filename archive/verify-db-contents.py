@@ -1,28 +1,53 @@
-from pymilvus import connections, Collection, utility
+from pymilvus import Collection, utility
+from concurrent.futures import ThreadPoolExecutor
+
+from milvus_conn import get_alias
+
+def inspect_collection(col_name, count_executor, using='default'):
+    """Load a collection and return (entity count, schema field names, sample sources)"""
+    col = Collection(col_name, using=using)
+    col.load()
+    field_names = [field.name for field in col.schema.fields]
+    # The entity count and the sample query are independent RPCs, so overlap them
+    num_entities = count_executor.submit(lambda: col.num_entities)
+    try:
+        results = col.query(expr="pk > 0", output_fields=["source"], limit=3)
+    except Exception:
+        # The query used to be skipped for empty collections; only its errors matter otherwise
+        if num_entities.result() > 0:
+            raise
+        results = []
+    samples = [r.get('source', 'N/A') for r in results]
+    return num_entities.result(), field_names, samples
 
 def main():
     print("Connecting to Milvus...")
-    connections.connect('default', host='milvus', port='19530')
+    alias = get_alias('milvus', 19530)
     print("Connected successfully!")
-    
+
     print("Listing all collections...")
-    collections = utility.list_collections()
+    collections = utility.list_collections(using=alias)
     print(f"Found {len(collections)} collections: {collections}")
-    
-    for col_name in collections:
+
+    # Load and query all collections concurrently; pymilvus releases the GIL during RPCs.
+    # Counts get their own pool so a collection worker never waits on a slot in its own pool
+    with ThreadPoolExecutor(max_workers=8) as executor, ThreadPoolExecutor(max_workers=8) as count_executor:
+        futures = {
+            col_name: executor.submit(inspect_collection, col_name, count_executor, using=alias)
+            for col_name in collections
+        }
+
+    for col_name, future in futures.items():
         try:
-            col = Collection(col_name)
-            col.load()
-            print(f"{col_name}: {col.num_entities} entities")
-            
+            num_entities, field_names, samples = future.result()
+            print(f"{col_name}: {num_entities} entities")
+
             # Get schema info
-            schema = col.schema
-            print(f"  Schema fields: {[field.name for field in schema.fields]}")
-            
+            print(f"  Schema fields: {field_names}")
+
             # Sample some data if available
-            if col.num_entities > 0:
-                results = col.query(expr="pk > 0", output_fields=["source"], limit=3)
-                print(f"  Sample sources: {[r.get('source', 'N/A') for r in results]}")
+            if num_entities > 0:
+                print(f"  Sample sources: {samples}")
             else:
                 print("  No entities found")
             print()
@@ -6,3 +6,13 @@ A standalone CLI tool for installing and managing NVIDIA RAG Blueprint deploymen
 __version__ = "0.1.0"
 __author__ = "NVIDIA RAG Installer Team"
 
+
+def __getattr__(name):
+    # Shared Rich console, created on first use so every module prints through
+    # one instance and plain imports of cli.* don't probe the terminal
+    if name == "console":
+        from rich.console import Console
+        global console
+        console = Console()
+        return console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
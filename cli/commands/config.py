@@ -1,14 +1,13 @@
 """Configuration management command module."""
 
 import typer
-from rich.console import Console
 from pathlib import Path
 from typing import Optional
 
 from cli.utils.config import ConfigManager
+from cli import console
 
 app = typer.Typer(name="config", help="Configuration management")
-console = Console()
 
 
 @app.command()
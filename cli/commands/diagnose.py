@@ -1,16 +1,15 @@
 """Diagnostic command module."""
 
 import typer
-from rich.console import Console
 from pathlib import Path
 from typing import Optional
 
 from cli.diagnostics.preflight import PreflightDiagnostics
 from cli.diagnostics.installation import InstallationDiagnostics
 from cli.diagnostics.post_install import PostInstallDiagnostics
+from cli import console
 
 app = typer.Typer(name="diagnose", help="Run diagnostic checks")
-console = Console()
 
 
 @app.command()
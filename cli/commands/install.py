@@ -1,16 +1,14 @@
 """Installation command module."""
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from typing import Optional
 from pathlib import Path
 
-from cli.wizard.installer import InstallationWizard
+from cli import console
 
 app = typer.Typer(name="install", help="Install NVIDIA RAG Blueprint")
-console = Console()
 
 
 @app.command()
@@ -33,6 +31,9 @@ def interactive(
     """
     console.print("\n[bold cyan]NVIDIA RAG Blueprint Installation Wizard[/bold cyan]\n")
     
+    # Imported here so --help and other subcommands skip the wizard stack
+    from cli.wizard.installer import InstallationWizard
+    
     try:
         wizard = InstallationWizard(
             config_file=config_file,
@@ -67,6 +68,9 @@ def from_config(
     
     console.print(f"\n[bold cyan]Installing from configuration:[/bold cyan] {config_file}\n")
     
+    # Imported here so --help and other subcommands skip the wizard stack
+    from cli.wizard.installer import InstallationWizard
+    
     try:
         wizard = InstallationWizard(
             config_file=config_file,
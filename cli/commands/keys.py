@@ -1,15 +1,28 @@
 """API key management command module."""
 
 import typer
-from rich.console import Console
 from typing import Optional
+from functools import lru_cache
 import getpass
 
-from cli.utils.secrets import SecretManager
-from cli.validators.api_keys import APIKeyValidator
+from cli import console
+from cli.utils import runtime
 
 app = typer.Typer(name="keys", help="API key management")
-console = Console()
+
+
+# Imported lazily so --help and other subcommands skip these dependencies,
+# and built once so repeated calls share the same handle
+@lru_cache(maxsize=1)
+def _secret_manager():
+    from cli.utils.secrets import SecretManager
+    return SecretManager()
+
+
+@lru_cache(maxsize=1)
+def _validator():
+    from cli.validators.api_keys import APIKeyValidator
+    return APIKeyValidator()
 
 
 @app.command()
@@ -44,7 +57,7 @@ def set(
         raise typer.Exit(1)
     
     # Validate format
-    validator = APIKeyValidator()
+    validator = _validator()
     if not validator.validate_format(key_type, key_value):
         console.print(f"[bold red]Error:[/bold red] Invalid {key_type} API key format")
         raise typer.Exit(1)
@@ -60,7 +73,7 @@ def set(
     
     # Store key
     try:
-        secret_manager = SecretManager()
+        secret_manager = _secret_manager()
         secret_manager.set_key(key_type, key_value)
         console.print(f"[green]✓ {key_type.upper()} API key stored successfully[/green]\n")
         
@@ -75,7 +88,7 @@ def list():
     List configured API keys (without showing values).
     """
     try:
-        secret_manager = SecretManager()
+        secret_manager = _secret_manager()
         keys = secret_manager.list_keys()
         
         if not keys:
@@ -109,24 +122,26 @@ def test(
     Test configured API keys.
     """
     try:
-        secret_manager = SecretManager()
-        validator = APIKeyValidator()
+        secret_manager = _secret_manager()
+        validator = _validator()
         
         key_types = [key_type] if key_type else ["nvidia", "openai", "anthropic"]
+        key_values = {kt: secret_manager.get_key(kt) for kt in key_types}
         
         console.print("\n[bold cyan]Testing API Keys[/bold cyan]\n")
         
+        # Each test is a round-trip to a different provider, so run them concurrently
+        results = runtime.run(validator.test_keys(
+            {kt: value for kt, value in key_values.items() if value}
+        ))
+        
         for kt in key_types:
-            key_value = secret_manager.get_key(kt)
-            if not key_value:
+            if kt not in results:
                 console.print(f"  {kt.upper():12} [yellow]Not configured[/yellow]")
-                continue
-            
-            console.print(f"  {kt.upper():12} ", end="")
-            if validator.test_key(kt, key_value):
-                console.print("[green]✓ Test passed[/green]")
+            elif results[kt]:
+                console.print(f"  {kt.upper():12} [green]✓ Test passed[/green]")
             else:
-                console.print("[red]✗ Test failed[/red]")
+                console.print(f"  {kt.upper():12} [red]✗ Test failed[/red]")
         
         console.print()
         
@@ -147,7 +162,7 @@ def remove(
         raise typer.Exit(1)
     
     try:
-        secret_manager = SecretManager()
+        secret_manager = _secret_manager()
         secret_manager.remove_key(key_type)
         console.print(f"[green]✓ {key_type.upper()} API key removed[/green]\n")
         
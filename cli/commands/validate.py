@@ -1,16 +1,13 @@
 """Validation command module."""
 
 import typer
-from rich.console import Console
+from concurrent.futures import ThreadPoolExecutor
 from rich.table import Table
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from cli.validators.system import SystemValidator
-from cli.validators.hardware import HardwareValidator
-from cli.validators.network import NetworkValidator
+from cli import console
 
 app = typer.Typer(name="validate", help="Validate system requirements")
-console = Console()
 
 
 @app.command()
@@ -25,6 +22,11 @@ def preflight(
     Validates system requirements, hardware capabilities, and network connectivity
     before starting the installation process.
     """
+    # Imported here so --help and other subcommands skip the validator stack
+    from cli.validators.system import SystemValidator
+    from cli.validators.hardware import HardwareValidator
+    from cli.validators.network import NetworkValidator
+    
     console.print("\n[bold cyan]Running Pre-Installation Validation[/bold cyan]\n")
     
     results = {
@@ -33,35 +35,31 @@ def preflight(
         "network": []
     }
     
-    # System validation
-    console.print("[yellow]Checking system requirements...[/yellow]")
-    system_validator = SystemValidator()
-    system_results = system_validator.validate_all()
-    results["system"] = system_results
-    
-    # Hardware validation (if inventory provided)
-    if inventory_file:
-        console.print("[yellow]Checking hardware requirements...[/yellow]")
-        hardware_validator = HardwareValidator(inventory_file)
-        hardware_results = hardware_validator.validate_all()
-        results["hardware"] = hardware_results
-    
-    # Network validation (if inventory provided)
-    if inventory_file:
-        console.print("[yellow]Checking network connectivity...[/yellow]")
-        network_validator = NetworkValidator(inventory_file)
-        network_results = network_validator.validate_all()
-        results["network"] = network_results
+    # The validators are independent and I/O bound (subprocess, SSH, sockets),
+    # so run them side by side and wait only as long as the slowest one
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        console.print("[yellow]Checking system requirements...[/yellow]")
+        futures = {"system": executor.submit(SystemValidator().validate_all)}
+        
+        # Hardware and network validation (if inventory provided)
+        if inventory_file:
+            console.print("[yellow]Checking hardware requirements...[/yellow]")
+            futures["hardware"] = executor.submit(
+                _stream_results, "Hardware", HardwareValidator(inventory_file).iter_results()
+            )
+            console.print("[yellow]Checking network connectivity...[/yellow]")
+            futures["network"] = executor.submit(
+                _stream_results, "Network", NetworkValidator(inventory_file).iter_results()
+            )
+        
+        for category, future in futures.items():
+            results[category] = future.result()
     
     # Display results
-    _display_validation_results(results)
+    passed, total = _display_validation_results(results)
     
     # Summary
-    all_passed = all(
-        all(check["status"] == "pass" for check in category)
-        for category in results.values()
-        if category
-    )
+    all_passed = passed == total
     
     if all_passed:
         console.print("\n[bold green]✓ All validation checks passed![/bold green]\n")
@@ -107,30 +105,55 @@ def all(
         console.print(f"[yellow]Post-installation checks skipped: {str(e)}[/yellow]")
 
 
-def _display_validation_results(results: dict):
-    """Display validation results in a formatted table."""
+# Pre-rendered status cells; anything other than pass is shown as a failure
+_STATUS_TEXT = {
+    "pass": "[green]✓ PASS[/green]",
+    "fail": "[red]✗ FAIL[/red]",
+    "warn": "[red]✗ WARN[/red]",
+}
+
+
+def _status_text(status: str) -> str:
+    return _STATUS_TEXT.get(status) or f"[red]✗ {status.upper()}[/red]"
+
+
+def _stream_results(category: str, checks: Iterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Print each check as its probe finishes and return them all for the summary."""
+    results = []
+    for check in checks:
+        console.print(f"  {_status_text(check['status'])} {category}: {check['name']}")
+        results.append(check)
+    return results
+
+
+def _display_validation_results(results: dict) -> Tuple[int, int]:
+    """Display validation results in a formatted table and return (passed, total)."""
+    rows = []
+    passed = 0
+    for category, checks in results.items():
+        if not checks:
+            continue
+        
+        category_name = category.capitalize()
+        for check in checks:
+            status = check["status"]
+            if status == "pass":
+                passed += 1
+            rows.append((category_name, check["name"], _status_text(status), check.get("message", "")))
+            category_name = ""
+    
+    # Nothing to call out, so skip building and measuring the table
+    if passed == len(rows):
+        console.print(f"[green]All {passed} checks passed[/green]")
+        return passed, len(rows)
+    
     table = Table(title="Validation Results", show_header=True, header_style="bold cyan")
     table.add_column("Category", style="cyan")
     table.add_column("Check", style="white")
     table.add_column("Status", style="white")
     table.add_column("Message", style="dim")
-    
-    for category, checks in results.items():
-        if not checks:
-            continue
-        
-        for i, check in enumerate(checks):
-            status_icon = "✓" if check["status"] == "pass" else "✗"
-            status_color = "green" if check["status"] == "pass" else "red"
-            status_text = f"[{status_color}]{status_icon} {check['status'].upper()}[/{status_color}]"
-            
-            category_name = category.capitalize() if i == 0 else ""
-            table.add_row(
-                category_name,
-                check["name"],
-                status_text,
-                check.get("message", "")
-            )
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
-
+    return passed, len(rows)
@@ -0,0 +1,21 @@
+"""Report serialization shared by the diagnostic modules."""
+
+from pathlib import Path
+from typing import Dict, Any
+
+# orjson is optional; it encodes indented JSON several times faster than the stdlib
+try:
+    import orjson
+
+    def _dumps(report: Dict[str, Any]) -> bytes:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+
+    def _dumps(report: Dict[str, Any]) -> bytes:
+        return json.dumps(report, indent=2).encode()
+
+
+def write_report(report: Dict[str, Any], file_path: str):
+    """Serialize a diagnostic report to JSON and write it in one call."""
+    Path(file_path).write_bytes(_dumps(report))
@@ -1,9 +1,9 @@
 """Post-installation diagnostics."""
 
 from typing import Dict, Any
-from rich.console import Console
 
-console = Console()
+from cli.diagnostics._io import write_report
+from cli import console
 
 
 class PostInstallDiagnostics:
@@ -22,7 +22,5 @@ class PostInstallDiagnostics:
     
     def export_report(self, report: Dict[str, Any], file_path: str):
         """Export diagnostic report to file."""
-        import json
-        with open(file_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_report(report, file_path)
 
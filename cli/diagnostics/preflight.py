@@ -1,11 +1,34 @@
 """Pre-installation diagnostics."""
 
 from typing import Dict, Any
-from rich.console import Console
 from rich.table import Table
-import json
 
-console = Console()
+from cli.diagnostics._io import write_report
+from cli import console
+
+
+class _ReportBuilder:
+    """Collects check results and keeps the summary counters current as they are added."""
+    
+    _COUNTERS = {"pass": "passed", "fail": "failed", "warn": "warnings"}
+    
+    def __init__(self, *categories: str):
+        self.summary = {
+            "total_checks": 0,
+            "passed": 0,
+            "failed": 0,
+            "warnings": 0
+        }
+        self.report: Dict[str, Any] = {category: {} for category in categories}
+        self.report["summary"] = self.summary
+    
+    def add(self, category: str, name: str, status: str, message: str = ""):
+        """Record a check result and update the matching counter."""
+        self.report[category][name] = {"status": status, "message": message}
+        self.summary["total_checks"] += 1
+        counter = self._COUNTERS.get(status)
+        if counter:
+            self.summary[counter] += 1
 
 
 class PreflightDiagnostics:
@@ -13,24 +36,12 @@ class PreflightDiagnostics:
     
     def run_all(self) -> Dict[str, Any]:
         """Run all preflight diagnostics."""
-        report = {
-            "system": {},
-            "network": {},
-            "hardware": {},
-            "summary": {
-                "total_checks": 0,
-                "passed": 0,
-                "failed": 0,
-                "warnings": 0
-            }
-        }
+        builder = _ReportBuilder("system", "network", "hardware")
         
         # Placeholder for actual diagnostics
-        report["system"]["python"] = {"status": "pass", "message": "Python check"}
-        report["summary"]["total_checks"] = 1
-        report["summary"]["passed"] = 1
+        builder.add("system", "python", "pass", "Python check")
         
-        return report
+        return builder.report
     
     def display_report(self, report: Dict[str, Any]):
         """Display diagnostic report."""
@@ -59,12 +70,11 @@ class PreflightDiagnostics:
         
         console.print(table)
         
-        # Summary
+        # Summary counters are maintained by _ReportBuilder, so no second pass is needed
         summary = report.get("summary", {})
         console.print(f"\n[bold]Summary:[/bold] {summary.get('passed', 0)}/{summary.get('total_checks', 0)} checks passed")
     
     def export_report(self, report: Dict[str, Any], file_path: str):
         """Export diagnostic report to file."""
-        with open(file_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_report(report, file_path)
 
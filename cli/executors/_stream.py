@@ -0,0 +1,122 @@
+"""
+Incremental subprocess output handling shared by the executors.
+"""
+
+import asyncio
+import logging
+import shlex
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lines kept per stream for long-running commands (helm --wait, playbooks)
+DEFAULT_TAIL_LINES = 500
+
+# Read buffer size; longer lines (e.g. single-line kubectl JSON) are
+# reassembled from buffer-sized chunks
+STREAM_LIMIT = 1024 * 1024
+
+
+class CommandLine:
+    """
+    Shell-quoted form of an argv, rendered only when read.
+    
+    Results carry one of these under "command"; most callers never look at it,
+    so the join is deferred until str() (or a comparison) needs it.
+    """
+    
+    __slots__ = ("argv",)
+    
+    def __init__(self, argv: List[str]):
+        self.argv = argv
+    
+    def __str__(self) -> str:
+        return shlex.join(self.argv)
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CommandLine):
+            return self.argv == other.argv
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+    
+    __hash__ = None
+
+
+async def _drain(stream: asyncio.StreamReader, sink: Deque[bytes], label: str):
+    """Read stream line by line until EOF, logging each line and appending it to sink."""
+    parts: List[bytes] = []
+    while True:
+        try:
+            parts.append(await stream.readuntil(b"\n"))
+        except asyncio.LimitOverrunError as e:
+            # No newline within STREAM_LIMIT; take the buffered bytes and keep reading
+            parts.append(await stream.read(e.consumed))
+            continue
+        except asyncio.IncompleteReadError as e:
+            # EOF; keep a final line that has no trailing newline
+            if e.partial:
+                parts.append(e.partial)
+            if not parts:
+                break
+        
+        line = b"".join(parts)
+        parts = []
+        sink.append(line)
+        logger.debug("%s: %s", label, line.decode(errors="replace").rstrip())
+
+
+async def _feed(stream: asyncio.StreamWriter, data: bytes):
+    """Write data to the child's stdin and close it."""
+    stream.write(data)
+    await stream.drain()
+    stream.close()
+
+
+async def run_streaming(
+    cmd: List[str],
+    max_lines: Optional[int] = DEFAULT_TAIL_LINES,
+    input: Optional[bytes] = None,
+    **kwargs
+) -> Tuple[int, str, str]:
+    """
+    Run a command, consuming stdout and stderr as they are produced.
+    
+    Args:
+        cmd: Command and arguments
+        max_lines: Lines of each stream to keep (None keeps everything)
+        input: Data to send to the command's stdin
+        **kwargs: Extra arguments for asyncio.create_subprocess_exec
+    
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=STREAM_LIMIT,
+        **kwargs
+    )
+    
+    stdout: Deque[bytes] = deque(maxlen=max_lines)
+    stderr: Deque[bytes] = deque(maxlen=max_lines)
+    tasks = [
+        _drain(process.stdout, stdout, cmd[0]),
+        _drain(process.stderr, stderr, cmd[0]),
+        process.wait()
+    ]
+    if input is not None:
+        tasks.append(_feed(process.stdin, input))
+    await asyncio.gather(*tasks)
+    
+    return (
+        process.returncode,
+        b"".join(stdout).decode(errors="replace"),
+        b"".join(stderr).decode(errors="replace")
+    )
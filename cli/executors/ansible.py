@@ -4,14 +4,36 @@ Ansible execution wrapper.
 
 import subprocess
 import asyncio
+import importlib.util
 import json
+import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+from cli.executors._stream import CommandLine, run_streaming
+
 logger = logging.getLogger(__name__)
 
+# Multiplexed SSH sockets live here; each task reuses one connection per host
+SSH_CONTROL_DIR = Path.home() / ".ansible" / "cp"
+DEFAULT_FORKS = 25
+
+# Persistent fact cache so repeat runs skip fact gathering
+FACT_CACHE_DIR = Path.home() / ".phaser" / "factcache"
+FACT_CACHE_TIMEOUT = 7200
+
+
+@lru_cache(maxsize=1)
+def _mitogen_strategy_path() -> Optional[str]:
+    """Locate the Mitogen strategy plugins without importing ansible_mitogen."""
+    spec = importlib.util.find_spec("ansible_mitogen")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(spec.submodule_search_locations[0], "plugins", "strategy")
+
 
 class AnsibleExecutor:
     """Executes Ansible playbooks."""
@@ -19,6 +41,30 @@ class AnsibleExecutor:
     def __init__(self, ansible_path: Optional[str] = None):
         self.ansible_path = ansible_path or "ansible-playbook"
         self.playbooks_dir = Path(__file__).parent.parent.parent / "playbooks"
+        self._playbooks_cache: Optional[Tuple[int, List[str]]] = None
+    
+    def _ansible_env(self, no_cache: bool = False) -> Dict[str, str]:
+        """Subprocess environment with SSH pipelining, ControlPersist and fact caching enabled."""
+        try:
+            SSH_CONTROL_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not create SSH control directory {SSH_CONTROL_DIR}: {e}")
+        
+        env = os.environ.copy()
+        # setdefault so settings from the caller's environment still win
+        env.setdefault("ANSIBLE_PIPELINING", "True")
+        env.setdefault("ANSIBLE_SSH_PIPELINING", "True")
+        env.setdefault(
+            "ANSIBLE_SSH_ARGS",
+            f"-o ControlMaster=auto -o ControlPersist=60s -o ControlPath={SSH_CONTROL_DIR}/%h-%p-%r"
+        )
+        env.setdefault("ANSIBLE_FORKS", str(DEFAULT_FORKS))
+        if not no_cache:
+            env.setdefault("ANSIBLE_GATHERING", "smart")
+            env.setdefault("ANSIBLE_CACHE_PLUGIN", "jsonfile")
+            env.setdefault("ANSIBLE_CACHE_PLUGIN_CONNECTION", str(FACT_CACHE_DIR))
+            env.setdefault("ANSIBLE_CACHE_PLUGIN_TIMEOUT", str(FACT_CACHE_TIMEOUT))
+        return env
     
     async def run_playbook(
         self,
@@ -27,7 +73,10 @@ class AnsibleExecutor:
         extra_vars: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
         skip_tags: Optional[List[str]] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        forks: Optional[int] = None,
+        no_cache: bool = False,
+        strategy: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Run an Ansible playbook.
@@ -39,6 +88,11 @@ class AnsibleExecutor:
             tags: Tags to run
             skip_tags: Tags to skip
             verbose: Enable verbose output
+            forks: Number of hosts to run against in parallel; defaults to
+                ANSIBLE_FORKS from the environment, else DEFAULT_FORKS
+            no_cache: Don't enable the persistent fact cache
+            strategy: Ansible strategy to use; defaults to mitogen_linear when
+                Mitogen is installed (pass "linear" to opt out)
         
         Returns:
             Dictionary with execution results
@@ -77,28 +131,45 @@ class AnsibleExecutor:
         if skip_tags:
             cmd.extend(["--skip-tags", ",".join(skip_tags)])
         
+        # Parallelism across hosts; an explicit value overrides ANSIBLE_FORKS
+        if forks is not None:
+            cmd.extend(["-f", str(forks)])
+        
         # Verbose mode
         if verbose:
             cmd.append("-vvv")
         
-        # Execute playbook
+        env = self._ansible_env(no_cache=no_cache)
+        
+        # Mitogen keeps a persistent interpreter per target instead of shipping
+        # a module over SSH for every task
+        mitogen_path = _mitogen_strategy_path()
+        if strategy:
+            env["ANSIBLE_STRATEGY"] = strategy
+        elif "ANSIBLE_STRATEGY" not in env and mitogen_path:
+            env["ANSIBLE_STRATEGY"] = "mitogen_linear"
+        if env.get("ANSIBLE_STRATEGY", "").startswith("mitogen") and mitogen_path:
+            # Add to, rather than defer to, a user-set plugin path so the
+            # mitogen strategy selected above can always be found
+            plugin_paths = [p for p in env.get("ANSIBLE_STRATEGY_PLUGINS", "").split(os.pathsep) if p]
+            if mitogen_path not in plugin_paths:
+                env["ANSIBLE_STRATEGY_PLUGINS"] = os.pathsep.join([*plugin_paths, mitogen_path])
+        
+        # Execute playbook, keeping only the tail of its output
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(self.playbooks_dir.parent)
+            returncode, stdout, stderr = await run_streaming(
+                cmd,
+                cwd=str(self.playbooks_dir.parent),
+                env=env
             )
             
-            stdout, stderr = await process.communicate()
-            
             return {
-                "success": process.returncode == 0,
-                "returncode": process.returncode,
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else "",
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stdout": stdout,
+                "stderr": stderr,
                 "playbook": str(playbook_path),
-                "command": " ".join(cmd)
+                "command": CommandLine(cmd)
             }
         
         except Exception as e:
@@ -155,7 +226,8 @@ class AnsibleExecutor:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                env=self._ansible_env()
             )
             
             stdout, stderr = await process.communicate()
@@ -165,7 +237,7 @@ class AnsibleExecutor:
                 "returncode": process.returncode,
                 "stdout": stdout.decode() if stdout else "",
                 "stderr": stderr.decode() if stderr else "",
-                "command": " ".join(cmd)
+                "command": CommandLine(cmd)
             }
         
         except Exception as e:
@@ -210,9 +282,20 @@ class AnsibleExecutor:
     
     def list_playbooks(self) -> List[str]:
         """List available playbooks."""
-        playbooks = []
-        if self.playbooks_dir.exists():
-            for playbook in self.playbooks_dir.glob("*.yml"):
-                playbooks.append(playbook.name)
-        return sorted(playbooks)
+        try:
+            mtime_ns = self.playbooks_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        
+        # Directory mtime changes whenever an entry is added, removed or renamed
+        if self._playbooks_cache and self._playbooks_cache[0] == mtime_ns:
+            return list(self._playbooks_cache[1])
+        
+        with os.scandir(self.playbooks_dir) as entries:
+            playbooks = sorted(
+                entry.name for entry in entries
+                if entry.name.endswith(".yml") and entry.is_file()
+            )
+        self._playbooks_cache = (mtime_ns, playbooks)
+        return list(playbooks)
 
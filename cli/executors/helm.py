@@ -4,18 +4,71 @@ Helm execution wrapper.
 
 import subprocess
 import asyncio
+import json
+import re
+import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+from cli.executors._stream import CommandLine, run_streaming
+
+# Prefer the libyaml-backed dumper; fall back to the pure-Python one
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 logger = logging.getLogger(__name__)
 
+# First Helm release with --set-json
+SET_JSON_MIN_VERSION = (3, 10)
+
 
 class HelmExecutor:
     """Executes Helm commands."""
     
     def __init__(self, helm_path: Optional[str] = None):
         self.helm_path = helm_path or "helm"
+        self._set_json: Optional[bool] = None
+    
+    async def _supports_set_json(self) -> bool:
+        """Whether the helm binary understands --set-json; checked once per executor."""
+        if self._set_json is None:
+            try:
+                returncode, stdout, _ = await run_streaming(
+                    [self.helm_path, "version", "--template", "{{.Version}}"]
+                )
+                match = re.match(r"v?(\d+)\.(\d+)", stdout.strip())
+                self._set_json = (
+                    returncode == 0
+                    and match is not None
+                    and tuple(map(int, match.groups())) >= SET_JSON_MIN_VERSION
+                )
+            except Exception as e:
+                logger.debug(f"Could not determine Helm version: {e}")
+                self._set_json = False
+        return self._set_json
+    
+    async def _values_args(self, values: Dict[str, Any]) -> Tuple[List[str], Optional[bytes]]:
+        """
+        Build the helm arguments for inline values without a temporary file.
+        
+        Flat values become --set-json flags on Helm 3.10+; anything else is
+        streamed as YAML on stdin via "--values -". Keys containing dots take
+        the YAML route too, because --set-json would read "a.b" as a nested
+        path where a values file keeps it as a literal key.
+        
+        Returns:
+            Tuple of (extra command arguments, stdin payload or None)
+        """
+        flat = not any(isinstance(value, (dict, list)) or "." in key for key, value in values.items())
+        if flat and await self._supports_set_json():
+            args = []
+            for key, value in values.items():
+                args.extend(["--set-json", f"{key}={json.dumps(value)}"])
+            return args, None
+        return ["--values", "-"], yaml.dump(values, Dumper=_Dumper).encode()
     
     async def install(
         self,
@@ -47,15 +100,12 @@ class HelmExecutor:
         if namespace:
             cmd.extend(["--namespace", namespace, "--create-namespace"])
         
+        values_input = None
         if values_file:
             cmd.extend(["--values", values_file])
         elif values:
-            # Create temporary values file
-            import tempfile
-            import yaml
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                yaml.dump(values, f)
-                cmd.extend(["--values", f.name])
+            values_args, values_input = await self._values_args(values)
+            cmd.extend(values_args)
         
         if wait:
             cmd.append("--wait")
@@ -64,21 +114,15 @@ class HelmExecutor:
             cmd.extend(["--timeout", timeout])
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
+            returncode, stdout, stderr = await run_streaming(cmd, input=values_input)
             
             return {
-                "success": process.returncode == 0,
-                "returncode": process.returncode,
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else "",
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stdout": stdout,
+                "stderr": stderr,
                 "release_name": release_name,
-                "command": " ".join(cmd)
+                "command": CommandLine(cmd)
             }
         
         except Exception as e:
@@ -89,6 +133,53 @@ class HelmExecutor:
                 "release_name": release_name
             }
     
+    async def install_many(
+        self,
+        specs: List[Dict[str, Any]],
+        concurrency: int = 8,
+        dependencies: Optional[Dict[str, List[str]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Install several Helm charts concurrently.
+        
+        Args:
+            specs: Keyword arguments for install(), one dict per release
+            concurrency: Maximum number of helm processes running at once
+            dependencies: Release name -> releases that must finish first (acyclic);
+                names not present in specs are assumed to be installed already
+        
+        Returns:
+            List of install results, in the same order as specs
+        """
+        dependencies = dependencies or {}
+        semaphore = asyncio.Semaphore(concurrency)
+        finished = {spec["release_name"]: asyncio.Event() for spec in specs}
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        async def run(spec: Dict[str, Any]) -> Dict[str, Any]:
+            release_name = spec["release_name"]
+            deps = [dep for dep in dependencies.get(release_name, []) if dep in finished]
+            try:
+                # Wait on dependencies before taking a slot so they can't starve it
+                for dep in deps:
+                    await finished[dep].wait()
+                
+                failed = [dep for dep in deps if not results[dep].get("success")]
+                if failed:
+                    results[release_name] = {
+                        "success": False,
+                        "error": f"Dependencies failed: {', '.join(failed)}",
+                        "release_name": release_name
+                    }
+                else:
+                    async with semaphore:
+                        results[release_name] = await self.install(**spec)
+            finally:
+                finished[release_name].set()
+            return results[release_name]
+        
+        return await asyncio.gather(*(run(spec) for spec in specs))
+    
     async def upgrade(
         self,
         release_name: str,
@@ -103,29 +194,21 @@ class HelmExecutor:
         if namespace:
             cmd.extend(["--namespace", namespace])
         
+        values_input = None
         if values_file:
             cmd.extend(["--values", values_file])
         elif values:
-            import tempfile
-            import yaml
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                yaml.dump(values, f)
-                cmd.extend(["--values", f.name])
+            values_args, values_input = await self._values_args(values)
+            cmd.extend(values_args)
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
+            returncode, stdout, stderr = await run_streaming(cmd, input=values_input)
             
             return {
-                "success": process.returncode == 0,
-                "returncode": process.returncode,
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else ""
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stdout": stdout,
+                "stderr": stderr
             }
         
         except Exception as e:
@@ -186,7 +269,6 @@ class HelmExecutor:
             stdout, stderr = await process.communicate()
             
             if process.returncode == 0:
-                import json
                 releases = json.loads(stdout.decode())
                 return releases
             else:
@@ -4,24 +4,132 @@ kubectl execution wrapper.
 
 import subprocess
 import asyncio
-import json
+import json as _stdlib_json
+import re
+import time
 from typing import Dict, Any, List, Optional
 import logging
 
+from cli.executors._stream import CommandLine, run_streaming
+
+# orjson is optional and much faster on large -o json listings; its
+# JSONDecodeError subclasses the stdlib one, so error handling is shared
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# httpx is optional; without it every call forks kubectl
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# kubectl proxy prints "Starting to serve on 127.0.0.1:<port>" once it is ready
+_PROXY_READY = re.compile(rb"serve on [^:\s]+:(\d+)")
+
 
 class KubectlExecutor:
     """Executes kubectl commands."""
     
-    def __init__(self, kubectl_path: Optional[str] = None, kubeconfig: Optional[str] = None):
+    def __init__(
+        self,
+        kubectl_path: Optional[str] = None,
+        kubeconfig: Optional[str] = None,
+        use_proxy: bool = False
+    ):
         self.kubectl_path = kubectl_path or "kubectl"
         self.kubeconfig = kubeconfig
+        # With use_proxy, read-only getters go through one long-lived kubectl proxy
+        # instead of forking kubectl per call; call aclose() (or use async with) to stop it
+        self.use_proxy = use_proxy and HTTPX_AVAILABLE
+        self._proxy_process: Optional[asyncio.subprocess.Process] = None
+        self._proxy_client: Optional["httpx.AsyncClient"] = None
+        self._proxy_lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "KubectlExecutor":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Stop the kubectl proxy and its HTTP client, if they were started."""
+        if self._proxy_client is not None:
+            await self._proxy_client.aclose()
+            self._proxy_client = None
+        if self._proxy_process is not None:
+            if self._proxy_process.returncode is None:
+                self._proxy_process.terminate()
+                await self._proxy_process.wait()
+            self._proxy_process = None
+    
+    async def _ensure_proxy(self) -> Optional["httpx.AsyncClient"]:
+        """Start kubectl proxy once and return a client for it, or None to fall back."""
+        if not self.use_proxy:
+            return None
+        
+        async with self._proxy_lock:
+            if self._proxy_client is not None:
+                return self._proxy_client
+            
+            cmd = [self.kubectl_path]
+            if self.kubeconfig:
+                cmd.extend(["--kubeconfig", self.kubeconfig])
+            cmd.extend(["proxy", "--port=0"])
+            
+            process = None
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                line = await asyncio.wait_for(process.stdout.readline(), timeout=10)
+                match = _PROXY_READY.search(line)
+                if not match:
+                    raise RuntimeError(f"unexpected kubectl proxy output: {line!r}")
+            except Exception as e:
+                logger.warning(f"kubectl proxy unavailable, falling back to kubectl calls: {e}")
+                if process is not None and process.returncode is None:
+                    process.terminate()
+                    await process.wait()
+                self.use_proxy = False
+                return None
+            
+            self._proxy_process = process
+            self._proxy_client = httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{match.group(1).decode()}",
+                timeout=30
+            )
+            return self._proxy_client
+    
+    async def _proxy_items(
+        self,
+        path: str,
+        params: Optional[Dict[str, str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """List objects through the kubectl proxy; None means use the kubectl fallback."""
+        client = await self._ensure_proxy()
+        if client is None:
+            return None
+        
+        try:
+            response = await client.get(path, params=params)
+            response.raise_for_status()
+            return _json.loads(response.content).get("items", [])
+        except Exception as e:
+            logger.warning(f"kubectl proxy request for {path} failed: {e}")
+            return None
     
     async def run_command(
         self,
         command: List[str],
-        namespace: Optional[str] = None
+        namespace: Optional[str] = None,
+        input: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         Run a kubectl command.
@@ -29,6 +137,7 @@ class KubectlExecutor:
         Args:
             command: kubectl command as list
             namespace: Target namespace
+            input: Data to send to kubectl on stdin
         
         Returns:
             Dictionary with execution results
@@ -44,20 +153,15 @@ class KubectlExecutor:
         cmd.extend(command)
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
+            # Output is often parsed as JSON by callers, so keep all of it
+            returncode, stdout, stderr = await run_streaming(cmd, max_lines=None, input=input)
             
             return {
-                "success": process.returncode == 0,
-                "returncode": process.returncode,
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else "",
-                "command": " ".join(cmd)
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stdout": stdout,
+                "stderr": stderr,
+                "command": CommandLine(cmd)
             }
         
         except Exception as e:
@@ -69,33 +173,112 @@ class KubectlExecutor:
     
     async def get_nodes(self) -> List[Dict[str, Any]]:
         """Get cluster nodes."""
+        items = await self._proxy_items("/api/v1/nodes")
+        if items is not None:
+            return items
+        
         result = await self.run_command(["get", "nodes", "-o", "json"])
         
         if result["success"]:
             try:
-                data = json.loads(result["stdout"])
+                data = _json.loads(result["stdout"])
                 return data.get("items", [])
-            except json.JSONDecodeError:
+            except _json.JSONDecodeError:
                 return []
         return []
     
-    async def get_pods(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get pods."""
-        result = await self.run_command(
-            ["get", "pods", "-o", "json"],
-            namespace=namespace
-        )
+    async def get_pods(
+        self,
+        namespace: Optional[str] = None,
+        fields: Optional[str] = None,
+        label_selector: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get pods.
+        
+        Args:
+            namespace: Target namespace
+            fields: Field selector, e.g. "status.phase=Running"
+            label_selector: Label selector, e.g. "app=milvus"
+        
+        Returns:
+            List of pod objects
+        """
+        # The proxy has no notion of the context's default namespace, so it is only
+        # used when the namespace is explicit
+        if namespace:
+            params = {}
+            if fields:
+                params["fieldSelector"] = fields
+            if label_selector:
+                params["labelSelector"] = label_selector
+            items = await self._proxy_items(f"/api/v1/namespaces/{namespace}/pods", params)
+            if items is not None:
+                return items
+        
+        command = ["get", "pods", "-o", "json"]
+        # Filter server-side so only matching pods are serialized and parsed
+        if fields:
+            command.extend(["--field-selector", fields])
+        if label_selector:
+            command.extend(["-l", label_selector])
+        
+        result = await self.run_command(command, namespace=namespace)
         
         if result["success"]:
             try:
-                data = json.loads(result["stdout"])
+                data = _json.loads(result["stdout"])
                 return data.get("items", [])
-            except json.JSONDecodeError:
+            except _json.JSONDecodeError:
                 return []
         return []
     
+    async def list_pod_names(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None
+    ) -> List[str]:
+        """List pod names only, without fetching or parsing full pod objects."""
+        command = ["get", "pods", "-o", "jsonpath={range .items[*]}{.metadata.name}{'\\n'}{end}"]
+        if label_selector:
+            command.extend(["-l", label_selector])
+        
+        result = await self.run_command(command, namespace=namespace)
+        if result["success"]:
+            return result["stdout"].split()
+        return []
+    
+    async def list_pod_status(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Map pod names to their phase, without fetching or parsing full pod objects."""
+        command = [
+            "get", "pods",
+            "-o", "jsonpath={range .items[*]}{.metadata.name}{' '}{.status.phase}{'\\n'}{end}"
+        ]
+        if label_selector:
+            command.extend(["-l", label_selector])
+        
+        result = await self.run_command(command, namespace=namespace)
+        if not result["success"]:
+            return {}
+        
+        statuses = {}
+        for line in result["stdout"].splitlines():
+            name, _, phase = line.partition(" ")
+            if name:
+                statuses[name] = phase
+        return statuses
+    
     async def get_services(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get services."""
+        if namespace:
+            items = await self._proxy_items(f"/api/v1/namespaces/{namespace}/services")
+            if items is not None:
+                return items
+        
         result = await self.run_command(
             ["get", "services", "-o", "json"],
             namespace=namespace
@@ -103,29 +286,20 @@ class KubectlExecutor:
         
         if result["success"]:
             try:
-                data = json.loads(result["stdout"])
+                data = _json.loads(result["stdout"])
                 return data.get("items", [])
-            except json.JSONDecodeError:
+            except _json.JSONDecodeError:
                 return []
         return []
     
     async def apply(self, manifest: str, namespace: Optional[str] = None) -> Dict[str, Any]:
         """Apply a Kubernetes manifest."""
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(manifest)
-            temp_file = f.name
-        
-        try:
-            result = await self.run_command(
-                ["apply", "-f", temp_file],
-                namespace=namespace
-            )
-            return result
-        finally:
-            import os
-            os.unlink(temp_file)
+        # Piped on stdin, so the manifest never touches disk
+        return await self.run_command(
+            ["apply", "-f", "-"],
+            namespace=namespace,
+            input=manifest.encode()
+        )
     
     async def delete(self, resource_type: str, resource_name: str, namespace: Optional[str] = None) -> Dict[str, Any]:
         """Delete a Kubernetes resource."""
@@ -140,17 +314,106 @@ class KubectlExecutor:
         namespace: Optional[str] = None,
         timeout: int = 300
     ) -> Dict[str, Any]:
-        """Wait for a deployment to be ready."""
+        """
+        Wait for a deployment to be ready.
+        
+        Watches the deployment and returns as soon as an event reports it Available,
+        instead of polling; falls back to `kubectl wait` if the watch can't be used.
+        """
+        timed_out = {
+            "success": False,
+            "error": f"Timed out after {timeout}s waiting for deployment/{deployment_name}"
+        }
+        deadline = time.monotonic() + timeout
+        try:
+            result = await asyncio.wait_for(
+                self._watch_until_available(deployment_name, namespace),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return timed_out
+        
+        if result is not None:
+            return result
+        
+        # The fallback only gets whatever the watch left of the budget
+        remaining = int(deadline - time.monotonic())
+        if remaining <= 0:
+            return timed_out
         return await self.run_command(
-            ["wait", "--for=condition=available", f"--timeout={timeout}s", f"deployment/{deployment_name}"],
+            ["wait", "--for=condition=available", f"--timeout={remaining}s", f"deployment/{deployment_name}"],
             namespace=namespace
         )
     
+    async def _watch_until_available(
+        self,
+        deployment_name: str,
+        namespace: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Stream watch events for a deployment; None if it ended without becoming Available."""
+        cmd = [self.kubectl_path]
+        if self.kubeconfig:
+            cmd.extend(["--kubeconfig", self.kubeconfig])
+        if namespace:
+            cmd.extend(["--namespace", namespace])
+        cmd.extend([
+            "get", f"deployment/{deployment_name}",
+            "--watch", "--output-watch-events=true", "-o", "json"
+        ])
+        
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            
+            # Events arrive as concatenated, pretty-printed JSON documents
+            decoder = _stdlib_json.JSONDecoder()
+            buffer = ""
+            while True:
+                chunk = await process.stdout.read(65536)
+                if not chunk:
+                    return None
+                buffer += chunk.decode(errors="replace")
+                
+                while True:
+                    buffer = buffer.lstrip()
+                    try:
+                        event, end = decoder.raw_decode(buffer)
+                    except ValueError:
+                        break
+                    buffer = buffer[end:]
+                    
+                    deployment = event.get("object", event)
+                    conditions = deployment.get("status", {}).get("conditions", [])
+                    if any(c.get("type") == "Available" and c.get("status") == "True" for c in conditions):
+                        return {
+                            "success": True,
+                            "returncode": 0,
+                            "stdout": f"deployment.apps/{deployment_name} condition met",
+                            "stderr": "",
+                            "command": CommandLine(cmd)
+                        }
+        
+        except Exception as e:
+            logger.warning(f"Watching deployment/{deployment_name} failed, falling back to kubectl wait: {e}")
+            return None
+        
+        finally:
+            # Also runs on timeout cancellation, so the watch never outlives the wait
+            if process is not None and process.returncode is None:
+                process.terminate()
+                await process.wait()
+    
     async def get_cluster_info(self) -> Dict[str, Any]:
         """Get cluster information."""
-        result = await self.run_command(["cluster-info"])
-        
-        version_result = await self.run_command(["version", "-o", "json"])
+        # Independent calls; run them together so auth plugin start-up overlaps
+        result, version_result = await asyncio.gather(
+            self.run_command(["cluster-info"]),
+            self.run_command(["version", "-o", "json"])
+        )
         
         info = {
             "cluster_info": result["stdout"] if result["success"] else "",
@@ -159,8 +422,8 @@ class KubectlExecutor:
         
         if version_result["success"]:
             try:
-                info["version"] = json.loads(version_result["stdout"])
-            except json.JSONDecodeError:
+                info["version"] = _json.loads(version_result["stdout"])
+            except _json.JSONDecodeError:
                 pass
         
         return info
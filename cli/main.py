@@ -3,13 +3,56 @@
 Main CLI entry point for NVIDIA RAG Blueprint installer.
 """
 
+import importlib
 import sys
 import typer
-from rich.console import Console
-from rich.text import Text
+from typer.core import TyperCommand, TyperGroup
 from typing import Optional
 
-from cli.commands import install, validate, diagnose, config, keys
+from cli import console
+from cli.utils import runtime
+
+# Command groups: name -> (module, help). Modules are imported only when their
+# group is dispatched, so --help, --version and other groups don't load them.
+COMMAND_GROUPS = {
+    "install": ("cli.commands.install", "Install NVIDIA RAG Blueprint"),
+    "validate": ("cli.commands.validate", "Validate system requirements"),
+    "diagnose": ("cli.commands.diagnose", "Run diagnostics"),
+    "config": ("cli.commands.config", "Configuration management"),
+    "keys": ("cli.commands.keys", "API key management"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that resolves command modules on first use."""
+    
+    _listing = False
+    
+    def list_commands(self, ctx):
+        return [*super().list_commands(ctx), *COMMAND_GROUPS]
+    
+    def get_command(self, ctx, name):
+        if name not in COMMAND_GROUPS:
+            return super().get_command(ctx, name)
+        
+        module_name, help_text = COMMAND_GROUPS[name]
+        if self._listing:
+            # Rendering the command list only needs names and help text
+            return TyperCommand(name, help=help_text)
+        
+        module = importlib.import_module(module_name)
+        command = typer.main.get_group(module.app)
+        command.name = name
+        command.help = help_text
+        return command
+    
+    def format_help(self, ctx, formatter):
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
 
 # Initialize Typer app
 app = typer.Typer(
@@ -17,18 +60,9 @@ app = typer.Typer(
     help="NVIDIA RAG Blueprint Installation Wizard",
     add_completion=False,
     rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
-# Initialize Rich console
-console = Console()
-
-# Add command groups
-app.add_typer(install.app, name="install", help="Install NVIDIA RAG Blueprint")
-app.add_typer(validate.app, name="validate", help="Validate system requirements")
-app.add_typer(diagnose.app, name="diagnose", help="Run diagnostics")
-app.add_typer(config.app, name="config", help="Configuration management")
-app.add_typer(keys.app, name="keys", help="API key management")
-
 
 @app.callback(invoke_without_command=True)
 def main(
@@ -63,6 +97,9 @@ def cli():
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] {str(e)}")
         sys.exit(1)
+    finally:
+        # One event loop serves the whole session; release it and anything bound to it
+        runtime.close()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,18 @@
 """Configuration file management."""
 
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from rich.console import Console
+from typing import Dict, Any, List, Optional, Tuple
 from rich.syntax import Syntax
 
-console = Console()
+from cli import console
+
+# Prefer the libyaml-backed loader/dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
 
 
 class ConfigManager:
@@ -14,6 +20,8 @@ class ConfigManager:
     
     def __init__(self, config_file: Optional[Path] = None):
         self.config_file = config_file or Path("phaser-config.yaml")
+        # ((st_mtime_ns, st_size), merged config) from the last successful parse
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
         self.default_config = {
             "blueprint_version": "v2.2.1",
             "nodes": [],
@@ -33,16 +41,24 @@ class ConfigManager:
     
     def load(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        if not self.config_file.exists():
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
             return self.default_config.copy()
         
+        # Reuse the last parse while the file is unchanged
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache and self._cache[0] == key:
+            return copy.deepcopy(self._cache[1])
+        
         try:
             with open(self.config_file) as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=_Loader) or {}
             # Merge with defaults
             merged = self.default_config.copy()
             merged.update(config)
-            return merged
+            self._cache = (key, merged)
+            return copy.deepcopy(merged)
         except Exception as e:
             console.print(f"[red]Error loading config: {e}[/red]")
             return self.default_config.copy()
@@ -51,10 +67,11 @@ class ConfigManager:
         """Save configuration to file."""
         target_file = file_path or self.config_file
         target_file.parent.mkdir(parents=True, exist_ok=True)
+        self._cache = None
         
         try:
             with open(target_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
         except Exception as e:
             console.print(f"[red]Error saving config: {e}[/red]")
             raise
@@ -76,7 +93,7 @@ class ConfigManager:
     
     def format_config(self, config: Dict[str, Any]) -> str:
         """Format configuration for display."""
-        yaml_str = yaml.dump(config, default_flow_style=False, sort_keys=False)
+        yaml_str = yaml.dump(config, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
         syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=True)
         return str(syntax)
     
@@ -0,0 +1,39 @@
+"""
+Shared asyncio runtime for a CLI session.
+
+Commands run their coroutines through run() so one event loop (and its child
+watcher) serves every subprocess and HTTP call in the session, instead of
+asyncio.run() building and tearing one down per call.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run(coro: Awaitable) -> Any:
+    """Run a coroutine to completion on the session's event loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+def close():
+    """Close the event loop; safe to call more than once."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+
+    try:
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+    finally:
+        asyncio.set_event_loop(None)
+        _loop.close()
+        _loop = None
@@ -1,9 +1,34 @@
 """Secret/API key management."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import yaml
+
+# Secrets are a flat key/value map, so they are stored as JSON; orjson is
+# optional and the stdlib json module is the fallback
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(secrets: dict) -> bytes:
+        return orjson.dumps(secrets, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(secrets: dict) -> bytes:
+        return json.dumps(secrets, indent=2).encode()
+
+
+@lru_cache(maxsize=8)
+def _read_secrets_file(path: str, mtime_ns: int) -> dict:
+    """Parse a secrets file once per (path, mtime) pair."""
+    return _loads(Path(path).read_bytes()) or {}
 
 
 class SecretManager:
@@ -11,7 +36,9 @@ class SecretManager:
     
     def __init__(self):
         self.config_dir = Path.home() / ".phaser"
-        self.secrets_file = self.config_dir / "secrets.yaml"
+        self.secrets_file = self.config_dir / "secrets.json"
+        # Written by earlier releases; migrated to secrets_file on first read
+        self.legacy_secrets_file = self.config_dir / "secrets.yaml"
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
     def set_key(self, key_type: str, key_value: str):
@@ -45,21 +72,43 @@ class SecretManager:
     
     def _load_secrets(self) -> dict:
         """Load secrets from file."""
-        if not self.secrets_file.exists():
+        try:
+            mtime_ns = self.secrets_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            if self.legacy_secrets_file.exists():
+                return self._migrate_legacy_secrets()
             return {}
         
+        # Repeated lookups only stat the file; it is re-parsed after it changes.
+        # Callers mutate the result, so hand out a copy of the cached dict.
         try:
-            with open(self.secrets_file) as f:
-                return yaml.safe_load(f) or {}
+            return dict(_read_secrets_file(str(self.secrets_file), mtime_ns))
         except Exception:
             return {}
     
+    def _migrate_legacy_secrets(self) -> dict:
+        """Rewrite a legacy secrets.yaml as secrets.json and remove it."""
+        import yaml
+        
+        try:
+            with open(self.legacy_secrets_file) as f:
+                secrets = yaml.safe_load(f) or {}
+        except Exception:
+            return {}
+        
+        self._save_secrets(secrets)
+        self.legacy_secrets_file.unlink()
+        return secrets
+    
     def _save_secrets(self, secrets: dict):
         """Save secrets to file."""
         # Set restrictive permissions
         self.secrets_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.secrets_file, 'w') as f:
-            yaml.dump(secrets, f, default_flow_style=False)
+        fd = os.open(self.secrets_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_dumps(secrets))
+        # mtime granularity can be coarse, so don't rely on it for our own writes
+        _read_secrets_file.cache_clear()
         
         # Set file permissions to 600 (read/write for owner only)
         self.secrets_file.chmod(0o600)
@@ -0,0 +1,103 @@
+"""Ansible inventory loading shared by the node validators."""
+
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+import logging
+
+import yaml
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+logger = logging.getLogger(__name__)
+
+# Parsed inventories are cached here, keyed on the inventory's path, and
+# reused while its mtime and size are unchanged
+CACHE_DIR = Path.home() / ".phaser" / "cache"
+
+
+def _cache_file(path: Path) -> Path:
+    digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:16]
+    return CACHE_DIR / f"inventory-{digest}.pickle"
+
+
+def load_inventory(inventory_file: Path) -> Dict[str, Any]:
+    """
+    Load an Ansible inventory file, skipping the YAML parse when it is unchanged.
+
+    The result is shared between callers and must be treated as read-only.
+    """
+    try:
+        st = os.stat(inventory_file)
+    except FileNotFoundError:
+        return {}
+    return _load_cached(str(inventory_file), st.st_mtime_ns, st.st_size)
+
+
+# Keyed on mtime and size so both validators share one parse per run, and an
+# edited file is picked up by the next call
+@lru_cache(maxsize=16)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    inventory_file = Path(path)
+    key = (mtime_ns, size)
+
+    cache_file = _cache_file(inventory_file)
+    try:
+        cached_key, inventory = pickle.loads(cache_file.read_bytes())
+        if cached_key == key:
+            return inventory
+    except Exception:
+        pass
+
+    try:
+        with open(inventory_file) as f:
+            inventory = yaml.load(f, Loader=_Loader) or {}
+    except Exception as e:
+        logger.error(f"Error loading inventory: {e}")
+        return {}
+
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps((key, inventory), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write inventory cache {cache_file}: {e}")
+
+    return inventory
+
+
+def get_nodes(inventory: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract node information from inventory."""
+    children = (inventory or {}).get("all", {}).get("children", {})
+
+    # Extract from kube_control_plane and kube_node groups
+    nodes = [
+        {
+            "hostname": hostname,
+            "ip": host_vars.get("ansible_host", ""),
+            "user": host_vars.get("ansible_user", "ubuntu"),
+            "ssh_key": host_vars.get("ansible_ssh_private_key_file", "~/.ssh/id_rsa"),
+            "is_master": group_name == "kube_control_plane",
+            "has_gpu": host_vars.get("gpu_enabled", False)
+        }
+        for group_name in ("kube_control_plane", "kube_node")
+        for hostname, host_vars in ((children.get(group_name) or {}).get("hosts") or {}).items()
+    ]
+
+    # Resolve each distinct key path once (nodes usually share one) so the
+    # per-probe SSH calls don't repeat expanduser() and the existence check
+    resolved = {path: os.path.expanduser(path) for path in {node["ssh_key"] for node in nodes}}
+    present = {path: os.path.exists(path) for path in resolved.values()}
+    for node in nodes:
+        node["ssh_key"] = resolved[node["ssh_key"]]
+        node["ssh_key_ok"] = present[node["ssh_key"]]
+
+    return nodes
@@ -0,0 +1,186 @@
+"""In-process SSH connections shared by the node validators."""
+
+import atexit
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Concurrent SSH sessions; stays within sshd's default MaxStartups of 10
+MAX_SSH_SESSIONS = 10
+
+# Options shared by every ssh command line the validators build (no PTY or
+# stdin, key auth only, multiplexed); ControlPath and ConnectTimeout vary per call
+SSH_BASE_OPTS = (
+    "-T", "-n",
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "BatchMode=yes",
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPersist=60s",
+    "-o", "PreferredAuthentications=publickey",
+    "-o", "IdentitiesOnly=yes",
+    "-o", "ConnectionAttempts=1",
+)
+
+# paramiko is optional; without it the validators shell out to ssh
+try:
+    import paramiko
+    PARAMIKO_AVAILABLE = True
+except ImportError:
+    PARAMIKO_AVAILABLE = False
+
+
+class SSHClientPool:
+    """
+    Keeps one connected paramiko client per (user, host, key) so repeated
+    probes reuse the transport instead of forking ssh and redoing key exchange.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, str, str], "paramiko.SSHClient"] = {}
+        self._locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _client(self, host: str, user: str, key_filename: str, connect_timeout: float) -> "paramiko.SSHClient":
+        """Return a live client for the target, connecting on first use."""
+        key = (user, host, key_filename)
+        with self._lock:
+            host_lock = self._locks.setdefault(key, threading.Lock())
+
+        # Per-target lock so concurrent probes to one host share a single connect
+        with host_lock:
+            client = self._clients.get(key)
+            transport = client.get_transport() if client is not None else None
+            if transport is not None and transport.is_active():
+                return client
+
+            client = paramiko.SSHClient()
+            # Matches the StrictHostKeyChecking=no the ssh command line used
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(
+                host,
+                username=user,
+                key_filename=key_filename,
+                timeout=connect_timeout,
+                banner_timeout=10,
+                allow_agent=False,
+                look_for_keys=False
+            )
+            self._clients[key] = client
+            return client
+
+    def run(
+        self,
+        host: str,
+        user: str,
+        key_filename: str,
+        command: str,
+        connect_timeout: float = 10,
+        timeout: float = 30
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command on a host, mirroring subprocess.run(["ssh", ...],
+        capture_output=True, timeout=timeout); output is returned as bytes.
+
+        Connection failures are reported as returncode 255 like the ssh client;
+        a command that outlives timeout raises subprocess.TimeoutExpired.
+        """
+        try:
+            client = self._client(host, user, key_filename, connect_timeout)
+        except Exception as e:
+            return subprocess.CompletedProcess(command, 255, b"", str(e).encode())
+
+        try:
+            _, stdout, stderr = client.exec_command(command, timeout=timeout)
+            out = stdout.read()
+            err = stderr.read()
+            returncode = stdout.channel.recv_exit_status()
+        except socket.timeout:
+            raise subprocess.TimeoutExpired(command, timeout)
+
+        return subprocess.CompletedProcess(command, returncode, out, err)
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Error closing SSH client: {e}")
+
+
+class SSHRunner:
+    """
+    Runs commands on inventory nodes for the validators.
+    
+    Uses pooled paramiko connections; when paramiko is not installed it falls
+    back to the ssh client, multiplexed through a private (0700) ControlPath
+    directory so repeat probes to a host still share one connection.
+    """
+
+    def __init__(self):
+        self._slots = threading.BoundedSemaphore(MAX_SSH_SESSIONS)
+        self._pool = SSHClientPool() if PARAMIKO_AVAILABLE else None
+        if self._pool is not None:
+            atexit.register(self._pool.close)
+        else:
+            self._control_dir = tempfile.mkdtemp(prefix="phaser-ssh-")
+            atexit.register(shutil.rmtree, self._control_dir, ignore_errors=True)
+
+    def run(
+        self,
+        node: Dict[str, Any],
+        command: str,
+        connect_timeout: float = 10,
+        timeout: float = 30
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command on a node, returning bytes output like subprocess.run.
+
+        Raises subprocess.TimeoutExpired if the command outlives timeout.
+        """
+        with self._slots:
+            if self._pool is not None:
+                return self._pool.run(
+                    node["ip"], node["user"], node["ssh_key"], command,
+                    connect_timeout=connect_timeout, timeout=timeout
+                )
+            return subprocess.run(
+                [
+                    "ssh",
+                    "-i", node["ssh_key"],
+                    *SSH_BASE_OPTS,
+                    "-o", f"ControlPath={self._control_dir}/%C",
+                    "-o", f"ConnectTimeout={connect_timeout}",
+                    f"{node['user']}@{node['ip']}",
+                    command
+                ],
+                capture_output=True,
+                timeout=timeout
+            )
+
+
+_runner: Optional[SSHRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_runner() -> SSHRunner:
+    """
+    Return the process-wide SSHRunner.
+    
+    Validators that run side by side share its connections and its
+    MAX_SSH_SESSIONS cap instead of each opening their own.
+    """
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = SSHRunner()
+        return _runner
@@ -1,8 +1,66 @@
 """API key validation."""
 
+import asyncio
 import re
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional
+
+# httpx is optional; without it test_keys runs the requests-based checks in threads
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One pooled session so repeated key tests reuse TLS connections to each provider
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+# (connect, read) timeouts in seconds
+_TIMEOUT = (3, 10)
+
+# Key type -> (accepted prefixes, length that is accepted regardless of prefix)
+_FORMATS = {
+    # NVIDIA API keys typically start with "nvapi-"; older keys are just long
+    "nvidia": (("nvapi-",), 21),
+    # OpenAI API keys start with "sk-"
+    "openai": (("sk-",), None),
+    # Anthropic API keys start with "sk-ant-"
+    "anthropic": (("sk-ant-",), None),
+}
+
+# Key type -> (test URL, headers for a key, status codes that mean the key works)
+_PROVIDERS = {
+    # Test NGC API access; 401 means key format is valid
+    "nvidia": (
+        "https://api.ngc.nvidia.com/v2/orgs",
+        lambda key: {"Authorization": f"Bearer {key}"},
+        (200, 401)
+    ),
+    "openai": (
+        "https://api.openai.com/v1/models",
+        lambda key: {"Authorization": f"Bearer {key}"},
+        (200,)
+    ),
+    # 400 is expected for GET without body, but means auth works
+    "anthropic": (
+        "https://api.anthropic.com/v1/messages",
+        lambda key: {"x-api-key": key, "anthropic-version": "2023-06-01"},
+        (200, 400)
+    ),
+}
 
 
 class APIKeyValidator:
@@ -10,60 +68,58 @@ class APIKeyValidator:
     
     def validate_format(self, key_type: str, key_value: str) -> bool:
         """Validate API key format."""
-        if key_type == "nvidia":
-            # NVIDIA API keys typically start with "nvapi-"
-            return key_value.startswith("nvapi-") or len(key_value) > 20
-        elif key_type == "openai":
-            # OpenAI API keys start with "sk-"
-            return key_value.startswith("sk-")
-        elif key_type == "anthropic":
-            # Anthropic API keys start with "sk-ant-"
-            return key_value.startswith("sk-ant-")
-        else:
+        key_format = _FORMATS.get(key_type)
+        if key_format is None:
             return False
+        
+        prefixes, min_length = key_format
+        return key_value.startswith(prefixes) or (
+            min_length is not None and len(key_value) >= min_length
+        )
     
     def test_key(self, key_type: str, key_value: str) -> bool:
         """Test API key connectivity."""
-        if key_type == "nvidia":
-            # Test NGC API access
-            try:
-                # Simple test - check if we can access NGC
-                response = requests.get(
-                    "https://api.ngc.nvidia.com/v2/orgs",
-                    headers={"Authorization": f"Bearer {key_value}"},
-                    timeout=10
-                )
-                return response.status_code in [200, 401]  # 401 means key format is valid
-            except Exception:
-                return False
+        provider = _PROVIDERS.get(key_type)
+        if provider is None:
+            return False
         
-        elif key_type == "openai":
-            # Test OpenAI API access
-            try:
-                response = requests.get(
-                    "https://api.openai.com/v1/models",
-                    headers={"Authorization": f"Bearer {key_value}"},
-                    timeout=10
-                )
-                return response.status_code == 200
-            except Exception:
-                return False
+        url, headers, ok_codes = provider
+        try:
+            response = _SESSION.get(url, headers=headers(key_value), timeout=_TIMEOUT)
+            return response.status_code in ok_codes
+        except Exception:
+            return False
+    
+    async def test_keys(self, keys: Dict[str, str]) -> Dict[str, bool]:
+        """
+        Test several API keys concurrently.
         
-        elif key_type == "anthropic":
-            # Test Anthropic API access
-            try:
-                response = requests.get(
-                    "https://api.anthropic.com/v1/messages",
-                    headers={
-                        "x-api-key": key_value,
-                        "anthropic-version": "2023-06-01"
-                    },
-                    timeout=10
+        Args:
+            keys: Key type -> key value
+        
+        Returns:
+            Key type -> whether the test passed
+        """
+        if HTTPX_AVAILABLE:
+            async with httpx.AsyncClient(timeout=10, http2=HTTP2_AVAILABLE) as client:
+                results = await asyncio.gather(
+                    *(self._check(client, key_type, key_value) for key_type, key_value in keys.items()),
+                    return_exceptions=True
                 )
-                # 400 is expected for GET without body, but means auth works
-                return response.status_code in [200, 400]
-            except Exception:
-                return False
+        else:
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self.test_key, key_type, key_value) for key_type, key_value in keys.items()),
+                return_exceptions=True
+            )
         
-        return False
-
+        return {key_type: result is True for key_type, result in zip(keys, results)}
+    
+    async def _check(self, client: "httpx.AsyncClient", key_type: str, key_value: str) -> bool:
+        """Test a single API key with a shared async client."""
+        provider = _PROVIDERS.get(key_type)
+        if provider is None:
+            return False
+        
+        url, headers, ok_codes = provider
+        response = await client.get(url, headers=headers(key_value))
+        return response.status_code in ok_codes
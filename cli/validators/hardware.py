@@ -1,77 +1,60 @@
 """Hardware requirements validation."""
 
-import yaml
 import subprocess
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 import logging
 
+from cli.validators._inventory import get_nodes, load_inventory
+from cli.validators._ssh import get_runner
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker threads for the per-node fan-out
+MAX_WORKERS = 32
+
+# Per-node probe commands, batched into a single SSH session by _run_probes
+NODE_PROBES = {
+    "cpu": "nproc",
+    "ram": "free -m | awk '/^Mem:/{print $2}'",
+    "storage": "df -B1 / | awk 'NR==2 {print $4}'",
+}
+
+# Extra probe for nodes with gpu_enabled: one line per GPU, or NO_SMI when
+# nvidia-smi is not installed
+GPU_PROBES = {
+    "gpu": (
+        "if command -v nvidia-smi >/dev/null; "
+        "then nvidia-smi --query-gpu=name --format=csv,noheader; "
+        "else echo NO_SMI; fi"
+    ),
+}
+
+# Marker printed after each batched probe, followed by the probe's exit status
+PROBE_END = "__phaser_probe_end__"
+_PROBE_END_BYTES = PROBE_END.encode()
+
 
 class HardwareValidator:
     """Validates hardware requirements."""
     
     def __init__(self, inventory_file: str):
         self.inventory_file = Path(inventory_file)
-        self.inventory = self._load_inventory()
-    
-    def _load_inventory(self) -> Dict[str, Any]:
-        """Load Ansible inventory file."""
-        if not self.inventory_file.exists():
-            return {}
-        
-        try:
-            with open(self.inventory_file) as f:
-                return yaml.safe_load(f) or {}
-        except Exception as e:
-            logger.error(f"Error loading inventory: {e}")
-            return {}
+        self.inventory = load_inventory(self.inventory_file)
+        self._ssh = get_runner()
     
     def _get_nodes(self) -> List[Dict[str, Any]]:
         """Extract node information from inventory."""
-        nodes = []
-        
-        if not self.inventory:
-            return nodes
-        
-        # Extract from kube_control_plane and kube_node groups
-        for group_name in ["kube_control_plane", "kube_node"]:
-            if "children" in self.inventory.get("all", {}):
-                children = self.inventory["all"]["children"]
-                if group_name in children and "hosts" in children[group_name]:
-                    for hostname, host_vars in children[group_name]["hosts"].items():
-                        nodes.append({
-                            "hostname": hostname,
-                            "ip": host_vars.get("ansible_host", ""),
-                            "user": host_vars.get("ansible_user", "ubuntu"),
-                            "ssh_key": host_vars.get("ansible_ssh_private_key_file", "~/.ssh/id_rsa"),
-                            "is_master": group_name == "kube_control_plane",
-                            "has_gpu": host_vars.get("gpu_enabled", False)
-                        })
-        
-        return nodes
+        return get_nodes(self.inventory)
     
     def _ssh_execute(self, node: Dict[str, Any], command: str) -> Dict[str, Any]:
         """Execute command on remote node via SSH."""
-        ssh_key = Path(node["ssh_key"]).expanduser()
-        if not ssh_key.exists():
-            return {"success": False, "error": f"SSH key not found: {ssh_key}"}
+        if not node["ssh_key_ok"]:
+            return {"success": False, "error": f"SSH key not found: {node['ssh_key']}"}
         
         try:
-            result = subprocess.run(
-                [
-                    "ssh",
-                    "-i", str(ssh_key),
-                    "-o", "StrictHostKeyChecking=no",
-                    "-o", "ConnectTimeout=10",
-                    f"{node['user']}@{node['ip']}",
-                    command
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = self._ssh.run(node, command, connect_timeout=10, timeout=30)
             
             return {
                 "success": result.returncode == 0,
@@ -84,33 +67,80 @@ class HardwareValidator:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _run_probes(self, node: Dict[str, Any], probes: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several commands over one SSH session.
+        
+        Returns a result per probe name, shaped like _ssh_execute's result
+        (stdout as bytes; int() parses the numeric probes without decoding).
+        """
+        # The leading newline keeps the marker on its own line even if a
+        # command's output lacks a trailing one
+        script = "\n".join(
+            f"{command}\nprintf '\\n{PROBE_END} %d\\n' $?" for command in probes.values()
+        )
+        result = self._ssh_execute(node, script)
+        if not result["success"]:
+            return {name: result for name in probes}
+        
+        outputs = {}
+        names = iter(probes)
+        lines = []
+        for line in result["stdout"].splitlines():
+            if line.startswith(_PROBE_END_BYTES):
+                returncode = int(line.split()[1])
+                outputs[next(names)] = {
+                    "success": returncode == 0,
+                    "stdout": b"\n".join(lines),
+                    "returncode": returncode
+                }
+                lines = []
+            else:
+                lines.append(line)
+        
+        for name in names:
+            outputs[name] = {"success": False, "error": "No output from probe"}
+        
+        return outputs
+    
     def validate_all(self) -> List[Dict[str, Any]]:
         """Run all hardware validation checks."""
-        results = []
+        return list(self.iter_results(ordered=True))
+    
+    def iter_results(self, ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yield hardware check results as each node finishes.
+        
+        Results arrive in completion order so callers can show progress;
+        pass ordered=True to get them in inventory order instead.
+        """
         nodes = self._get_nodes()
         
         if not nodes:
-            results.append({
+            yield {
                 "name": "Hardware Validation",
                 "status": "fail",
                 "message": "No nodes found in inventory file"
-            })
-            return results
-        
-        # Validate each node
-        for node in nodes:
-            node_results = self._validate_node(node)
-            results.extend(node_results)
+            }
+            return
         
-        return results
+        # Nodes are independent and each check waits on SSH round-trips,
+        # so validate them concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(nodes))) as executor:
+            futures = [executor.submit(self._validate_node, node) for node in nodes]
+            for future in (futures if ordered else as_completed(futures)):
+                yield from future.result()
     
     def _validate_node(self, node: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Validate hardware for a single node."""
         results = []
         node_name = node["hostname"]
         
+        probes = {**NODE_PROBES, **GPU_PROBES} if node.get("has_gpu") else NODE_PROBES
+        outputs = self._run_probes(node, probes)
+        
         # Check CPU
-        cpu_result = self._check_cpu(node)
+        cpu_result = self._check_cpu(node, outputs["cpu"])
         results.append({
             "name": f"{node_name} - CPU",
             "status": cpu_result["status"],
@@ -118,7 +148,7 @@ class HardwareValidator:
         })
         
         # Check RAM
-        ram_result = self._check_ram(node)
+        ram_result = self._check_ram(node, outputs["ram"])
         results.append({
             "name": f"{node_name} - RAM",
             "status": ram_result["status"],
@@ -126,7 +156,7 @@ class HardwareValidator:
         })
         
         # Check Storage
-        storage_result = self._check_storage(node)
+        storage_result = self._check_storage(node, outputs["storage"])
         results.append({
             "name": f"{node_name} - Storage",
             "status": storage_result["status"],
@@ -135,7 +165,7 @@ class HardwareValidator:
         
         # Check GPU (if GPU node)
         if node.get("has_gpu"):
-            gpu_result = self._check_gpu(node)
+            gpu_result = self._check_gpu(node, outputs["gpu"])
             results.append({
                 "name": f"{node_name} - GPU",
                 "status": gpu_result["status"],
@@ -144,10 +174,8 @@ class HardwareValidator:
         
         return results
     
-    def _check_cpu(self, node: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_cpu(self, node: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
         """Check CPU cores."""
-        result = self._ssh_execute(node, "nproc")
-        
         if not result["success"]:
             return {
                 "status": "fail",
@@ -174,10 +202,8 @@ class HardwareValidator:
                 "message": "Could not parse CPU count"
             }
     
-    def _check_ram(self, node: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_ram(self, node: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
         """Check RAM."""
-        result = self._ssh_execute(node, "free -m | awk '/^Mem:/{print $2}'")
-        
         if not result["success"]:
             return {
                 "status": "fail",
@@ -205,80 +231,72 @@ class HardwareValidator:
                 "message": "Could not parse RAM"
             }
     
-    def _check_storage(self, node: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_storage(self, node: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
         """Check available storage."""
-        result = self._ssh_execute(node, "df -h / | awk 'NR==2 {print $4}'")
-        
         if not result["success"]:
             return {
                 "status": "fail",
                 "message": f"Cannot check storage: {result.get('error', 'SSH failed')}"
             }
         
-        storage_str = result["stdout"].strip()
         min_storage_gb = 50
         
-        # Parse storage (handles formats like "50G", "50000M")
         try:
-            if storage_str.endswith("G"):
-                storage_gb = float(storage_str[:-1])
-            elif storage_str.endswith("M"):
-                storage_gb = float(storage_str[:-1]) / 1024
-            else:
-                storage_gb = float(storage_str) / (1024**3)  # Assume bytes
-            
-            if storage_gb >= min_storage_gb:
-                return {
-                    "status": "pass",
-                    "message": f"{storage_gb:.1f} GB available (minimum: {min_storage_gb} GB)"
-                }
-            else:
-                return {
-                    "status": "warn",
-                    "message": f"{storage_gb:.1f} GB available (minimum: {min_storage_gb} GB recommended)"
-                }
-        except (ValueError, AttributeError):
+            storage_gb = int(result["stdout"].strip()) / (1024**3)
+        except ValueError:
+            return {
+                "status": "warn",
+                "message": f"Storage: {result['stdout'].decode(errors='replace').strip()} (could not parse)"
+            }
+        
+        if storage_gb >= min_storage_gb:
+            return {
+                "status": "pass",
+                "message": f"{storage_gb:.1f} GB available (minimum: {min_storage_gb} GB)"
+            }
+        else:
             return {
                 "status": "warn",
-                "message": f"Storage: {storage_str} (could not parse)"
+                "message": f"{storage_gb:.1f} GB available (minimum: {min_storage_gb} GB recommended)"
             }
     
-    def _check_gpu(self, node: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_gpu(self, node: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
         """Check GPU availability."""
-        # Check if nvidia-smi is available
-        result = self._ssh_execute(node, "which nvidia-smi")
+        if "error" in result:
+            return {
+                "status": "warn",
+                "message": f"Cannot check GPU: {result['error']}"
+            }
+        
+        # ssh exits 255 when the batched call itself failed, so no probe ran
+        if result.get("returncode") == 255:
+            return {
+                "status": "warn",
+                "message": f"Cannot check GPU: SSH failed: {result['stderr'].decode(errors='replace').strip()}"
+            }
         
-        if not result["success"] or not result["stdout"].strip():
+        # Check if nvidia-smi is available
+        if result["success"] and result["stdout"].startswith(b"NO_SMI"):
             return {
                 "status": "warn",
                 "message": "nvidia-smi not found (GPU drivers may not be installed)"
             }
         
-        # Check GPU count
-        gpu_result = self._ssh_execute(node, "nvidia-smi --list-gpus | wc -l")
+        if not result["success"]:
+            return {
+                "status": "warn",
+                "message": "GPU detected but could not get details"
+            }
         
-        if gpu_result["success"]:
-            try:
-                gpu_count = int(gpu_result["stdout"].strip())
-                if gpu_count > 0:
-                    # Get GPU model
-                    model_result = self._ssh_execute(node, "nvidia-smi --query-gpu=name --format=csv,noheader | head -1")
-                    gpu_model = model_result["stdout"].strip() if model_result["success"] else "Unknown"
-                    
-                    return {
-                        "status": "pass",
-                        "message": f"{gpu_count} GPU(s) detected: {gpu_model}"
-                    }
-                else:
-                    return {
-                        "status": "fail",
-                        "message": "No GPUs detected"
-                    }
-            except ValueError:
-                pass
+        # One line per GPU, so the count comes for free
+        names = result["stdout"].decode(errors="replace").strip().splitlines()
+        if not names:
+            return {
+                "status": "fail",
+                "message": "No GPUs detected"
+            }
         
         return {
-            "status": "warn",
-            "message": "GPU detected but could not get details"
+            "status": "pass",
+            "message": f"{len(names)} GPU(s) detected: {names[0].strip()}"
         }
-
@@ -1,114 +1,101 @@
 """Network connectivity validation."""
 
-import yaml
 import subprocess
+import errno
+import selectors
 import socket
-from typing import List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Callable, Iterator, Tuple
 from pathlib import Path
 import logging
 
+from cli.validators._inventory import get_nodes, load_inventory
+from cli.validators._ssh import get_runner
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker threads for the probe fan-out
+MAX_WORKERS = 32
+
+# A named probe: (result name, callable, args)
+Check = Tuple[str, Callable[..., Dict[str, Any]], tuple]
+
 
 class NetworkValidator:
     """Validates network connectivity."""
     
     def __init__(self, inventory_file: str):
         self.inventory_file = Path(inventory_file)
-        self.inventory = self._load_inventory()
-    
-    def _load_inventory(self) -> Dict[str, Any]:
-        """Load Ansible inventory file."""
-        if not self.inventory_file.exists():
-            return {}
-        
-        try:
-            with open(self.inventory_file) as f:
-                return yaml.safe_load(f) or {}
-        except Exception as e:
-            logger.error(f"Error loading inventory: {e}")
-            return {}
+        self.inventory = load_inventory(self.inventory_file)
+        self._ssh = get_runner()
     
     def _get_nodes(self) -> List[Dict[str, Any]]:
         """Extract node information from inventory."""
-        nodes = []
-        
-        if not self.inventory:
-            return nodes
-        
-        # Extract from kube_control_plane and kube_node groups
-        for group_name in ["kube_control_plane", "kube_node"]:
-            if "children" in self.inventory.get("all", {}):
-                children = self.inventory["all"]["children"]
-                if group_name in children and "hosts" in children[group_name]:
-                    for hostname, host_vars in children[group_name]["hosts"].items():
-                        nodes.append({
-                            "hostname": hostname,
-                            "ip": host_vars.get("ansible_host", ""),
-                            "user": host_vars.get("ansible_user", "ubuntu"),
-                            "ssh_key": host_vars.get("ansible_ssh_private_key_file", "~/.ssh/id_rsa"),
-                            "is_master": group_name == "kube_control_plane"
-                        })
-        
-        return nodes
+        return get_nodes(self.inventory)
     
     def validate_all(self) -> List[Dict[str, Any]]:
         """Run all network validation checks."""
-        results = []
+        return list(self.iter_results(ordered=True))
+    
+    def iter_results(self, ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yield network check results as each probe finishes.
+        
+        Results arrive in completion order so callers can show progress;
+        pass ordered=True to get them in check order instead.
+        """
         nodes = self._get_nodes()
         
         if not nodes:
-            results.append({
+            yield {
                 "name": "Network Validation",
                 "status": "fail",
                 "message": "No nodes found in inventory file"
-            })
-            return results
+            }
+            return
         
         # Test SSH connectivity to all nodes
-        for node in nodes:
-            ssh_result = self._test_ssh(node)
-            results.append({
-                "name": f"{node['hostname']} - SSH",
-                "status": ssh_result["status"],
-                "message": ssh_result["message"]
-            })
+        checks: List[Check] = [
+            (f"{node['hostname']} - SSH", self._test_ssh, (node,))
+            for node in nodes
+        ]
         
         # Test inter-node connectivity
         if len(nodes) > 1:
-            connectivity_result = self._test_inter_node_connectivity(nodes)
-            results.extend(connectivity_result)
-        
-        # Test required ports
-        port_result = self._test_ports(nodes)
-        results.extend(port_result)
+            checks.extend(self._inter_node_checks(nodes))
         
-        return results
+        # Every probe is independent and mostly waits on the network, so run
+        # them all at once
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(checks) + 1)) as executor:
+            names = {executor.submit(check, *args): name for name, check, args in checks}
+            
+            # Test required ports; one batch covers every master and port
+            ports = executor.submit(self._test_ports, nodes)
+            
+            futures = [*names, ports]
+            for future in (futures if ordered else as_completed(futures)):
+                if future is ports:
+                    yield from future.result()
+                    continue
+                
+                result = future.result()
+                yield {
+                    "name": names[future],
+                    "status": result["status"],
+                    "message": result["message"]
+                }
     
     def _test_ssh(self, node: Dict[str, Any]) -> Dict[str, Any]:
         """Test SSH connectivity to a node."""
-        ssh_key = Path(node["ssh_key"]).expanduser()
-        if not ssh_key.exists():
+        if not node["ssh_key_ok"]:
             return {
                 "status": "fail",
-                "message": f"SSH key not found: {ssh_key}"
+                "message": f"SSH key not found: {node['ssh_key']}"
             }
         
         try:
-            result = subprocess.run(
-                [
-                    "ssh",
-                    "-i", str(ssh_key),
-                    "-o", "StrictHostKeyChecking=no",
-                    "-o", "ConnectTimeout=5",
-                    "-o", "BatchMode=yes",
-                    f"{node['user']}@{node['ip']}",
-                    "echo 'SSH connection successful'"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = self._ssh.run(node, "echo 'SSH connection successful'", connect_timeout=5, timeout=10)
             
             if result.returncode == 0:
                 return {
@@ -118,7 +105,7 @@ class NetworkValidator:
             else:
                 return {
                     "status": "fail",
-                    "message": f"SSH connection failed: {result.stderr.strip()}"
+                    "message": f"SSH connection failed: {result.stderr.decode(errors='replace').strip()}"
                 }
         except subprocess.TimeoutExpired:
             return {
@@ -131,74 +118,69 @@ class NetworkValidator:
                 "message": f"SSH test error: {str(e)}"
             }
     
-    def _test_inter_node_connectivity(self, nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Test connectivity between nodes."""
-        results = []
-        
+    def _inter_node_checks(self, nodes: List[Dict[str, Any]]) -> List[Check]:
+        """Build connectivity checks between nodes."""
         # Test from first node to others
         if not nodes:
-            return results
+            return []
         
         master_node = next((n for n in nodes if n.get("is_master")), nodes[0])
         
-        for node in nodes:
-            if node["ip"] == master_node["ip"]:
-                continue
-            
-            result = self._test_ping(master_node, node)
-            results.append({
-                "name": f"{master_node['hostname']} -> {node['hostname']}",
-                "status": result["status"],
-                "message": result["message"]
-            })
-        
-        return results
+        return [
+            (f"{master_node['hostname']} -> {node['hostname']}", self._test_reach, (master_node, node))
+            for node in nodes
+            if node["ip"] != master_node["ip"]
+        ]
     
-    def _test_ping(self, from_node: Dict[str, Any], to_node: Dict[str, Any]) -> Dict[str, Any]:
-        """Test ping from one node to another."""
-        ssh_key = Path(from_node["ssh_key"]).expanduser()
-        if not ssh_key.exists():
+    def _test_reach(self, from_node: Dict[str, Any], to_node: Dict[str, Any]) -> Dict[str, Any]:
+        """Test that one node can open a TCP connection to another's SSH port."""
+        if not from_node["ssh_key_ok"]:
             return {
                 "status": "fail",
                 "message": "SSH key not found"
             }
         
+        # A single TCP handshake to port 22 proves the route and firewall path
+        # the cluster needs, without three ICMP round-trips; bash's /dev/tcp
+        # stands in on hosts without nc
+        ip = to_node["ip"]
+        reach_command = (
+            f"if command -v nc >/dev/null 2>&1; then nc -z -w 2 {ip} 22; "
+            f"else timeout 2 bash -c '</dev/tcp/{ip}/22'; fi"
+        )
+        
         try:
-            result = subprocess.run(
-                [
-                    "ssh",
-                    "-i", str(ssh_key),
-                    "-o", "StrictHostKeyChecking=no",
-                    "-o", "ConnectTimeout=5",
-                    "-o", "BatchMode=yes",
-                    f"{from_node['user']}@{from_node['ip']}",
-                    f"ping -c 3 -W 2 {to_node['ip']}"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
+            result = self._ssh.run(from_node, reach_command, connect_timeout=5, timeout=10)
             
             if result.returncode == 0:
                 return {
                     "status": "pass",
-                    "message": f"Ping successful to {to_node['ip']}"
+                    "message": f"Connection successful to {to_node['ip']}:22"
+                }
+            elif result.returncode == 255:
+                # ssh's own exit status: the source node is the problem, not the target
+                return {
+                    "status": "fail",
+                    "message": f"SSH to {from_node['ip']} failed: {result.stderr.decode(errors='replace').strip()}"
+                }
+            elif result.returncode == 127:
+                return {
+                    "status": "warn",
+                    "message": f"Could not test {to_node['ip']}:22: neither nc nor bash is available"
                 }
             else:
                 return {
                     "status": "fail",
-                    "message": f"Ping failed to {to_node['ip']}"
+                    "message": f"Connection failed to {to_node['ip']}:22"
                 }
         except Exception as e:
             return {
                 "status": "fail",
-                "message": f"Ping test error: {str(e)}"
+                "message": f"Connectivity test error: {str(e)}"
             }
     
     def _test_ports(self, nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Test required ports are accessible."""
-        results = []
-        
         # Required ports for Kubernetes
         required_ports = {
             6443: "Kubernetes API",
@@ -210,10 +192,14 @@ class NetworkValidator:
         
         # Test ports on master nodes
         master_nodes = [n for n in nodes if n.get("is_master")]
+        probes = self._probe_ports(
+            [(node["ip"], port) for node in master_nodes for port in required_ports]
+        )
         
+        results = []
         for node in master_nodes:
             for port, description in required_ports.items():
-                result = self._test_port(node["ip"], port)
+                result = probes[(node["ip"], port)]
                 results.append({
                     "name": f"{node['hostname']} - Port {port} ({description})",
                     "status": result["status"],
@@ -224,25 +210,64 @@ class NetworkValidator:
     
     def _test_port(self, host: str, port: int, timeout: int = 3) -> Dict[str, Any]:
         """Test if a port is open."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            
-            if result == 0:
+        return self._probe_ports([(host, port)], timeout)[(host, port)]
+    
+    def _probe_ports(self, targets: List[Tuple[str, int]], timeout: float = 3) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """
+        Test many (host, port) pairs at once.
+        
+        All connects are started non-blocking and awaited together, so the
+        whole batch takes at most one timeout rather than one per port.
+        """
+        results = {}
+        
+        def port_result(port: int, is_open: bool) -> Dict[str, Any]:
+            if is_open:
                 return {
                     "status": "pass",
                     "message": f"Port {port} is open"
                 }
-            else:
-                return {
-                    "status": "warn",
-                    "message": f"Port {port} is not accessible (may be firewalled)"
-                }
-        except Exception as e:
             return {
                 "status": "warn",
-                "message": f"Could not test port {port}: {str(e)}"
+                "message": f"Port {port} is not accessible (may be firewalled)"
             }
-
+        
+        with selectors.DefaultSelector() as selector:
+            for host, port in dict.fromkeys(targets):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                try:
+                    sock.setblocking(False)
+                    err = sock.connect_ex((host, port))
+                except Exception as e:
+                    sock.close()
+                    results[(host, port)] = {
+                        "status": "warn",
+                        "message": f"Could not test port {port}: {str(e)}"
+                    }
+                    continue
+                
+                if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    selector.register(sock, selectors.EVENT_WRITE, (host, port))
+                else:
+                    sock.close()
+                    results[(host, port)] = port_result(port, err == 0)
+            
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    selector.unregister(sock)
+                    sock.close()
+                    results[key.data] = port_result(key.data[1], err == 0)
+            
+            # Anything still pending timed out
+            for key in list(selector.get_map().values()):
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+                results[key.data] = port_result(key.data[1], False)
+        
+        return results
@@ -2,7 +2,6 @@
 
 from pathlib import Path
 from typing import Optional, Dict, Any
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -11,8 +10,7 @@ import yaml
 from cli.utils.config import ConfigManager
 from cli.validators.system import SystemValidator
 from cli.utils.secrets import SecretManager
-
-console = Console()
+from cli import console
 
 
 class InstallationWizard:
@@ -1,27 +1,45 @@
 """Tests for Ansible executor."""
 
+import asyncio
+import os
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
-from pathlib import Path
 from cli.executors.ansible import AnsibleExecutor
 
 
+def _stream_reader(data):
+    """Create a StreamReader mock that yields data line by line, then EOF."""
+    reader = AsyncMock()
+    reader.readuntil = AsyncMock(side_effect=[
+        *data.splitlines(keepends=True), asyncio.IncompleteReadError(b"", None)
+    ])
+    return reader
+
+
+def _streaming_process(stdout=b"", stderr=b"", returncode=0):
+    """Create a subprocess mock whose pipes yield output line by line."""
+    process = AsyncMock()
+    process.stdout = _stream_reader(stdout)
+    process.stderr = _stream_reader(stderr)
+    process.returncode = returncode
+    return process
+
+
 class TestAnsibleExecutor:
     """Test AnsibleExecutor class."""
     
     @pytest.fixture
-    def executor(self):
-        """Create AnsibleExecutor instance."""
+    def executor(self, temp_dir, monkeypatch):
+        """Create AnsibleExecutor instance with its state dirs kept out of $HOME."""
+        monkeypatch.setattr("cli.executors.ansible.SSH_CONTROL_DIR", temp_dir / "cp")
+        monkeypatch.setattr("cli.executors.ansible.FACT_CACHE_DIR", temp_dir / "factcache")
         return AnsibleExecutor()
     
     @pytest.mark.asyncio
     async def test_run_playbook_success(self, executor, inventory_file):
         """Test successful playbook execution."""
         with patch('asyncio.create_subprocess_exec') as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.communicate = AsyncMock(return_value=(b"stdout", b""))
-            mock_process.returncode = 0
-            mock_subprocess.return_value = mock_process
+            mock_subprocess.return_value = _streaming_process(b"stdout", b"", 0)
             
             result = await executor.run_playbook(
                 playbook="01-kubespray.yml",
@@ -30,15 +48,14 @@ class TestAnsibleExecutor:
             
             assert result["success"] is True
             assert result["returncode"] == 0
+            # Without an explicit forks, ANSIBLE_FORKS in the environment decides
+            assert "-f" not in mock_subprocess.call_args[0]
     
     @pytest.mark.asyncio
     async def test_run_playbook_failure(self, executor, inventory_file):
         """Test failed playbook execution."""
         with patch('asyncio.create_subprocess_exec') as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.communicate = AsyncMock(return_value=(b"", b"error"))
-            mock_process.returncode = 1
-            mock_subprocess.return_value = mock_process
+            mock_subprocess.return_value = _streaming_process(b"", b"error", 1)
             
             result = await executor.run_playbook(
                 playbook="01-kubespray.yml",
@@ -47,15 +64,13 @@ class TestAnsibleExecutor:
             
             assert result["success"] is False
             assert result["returncode"] == 1
+            assert result["stderr"] == "error"
     
     @pytest.mark.asyncio
     async def test_run_playbook_with_extra_vars(self, executor, inventory_file):
         """Test playbook execution with extra variables."""
         with patch('asyncio.create_subprocess_exec') as mock_subprocess:
-            mock_process = AsyncMock()
-            mock_process.communicate = AsyncMock(return_value=(b"stdout", b""))
-            mock_process.returncode = 0
-            mock_subprocess.return_value = mock_process
+            mock_subprocess.return_value = _streaming_process(b"stdout", b"", 0)
             
             result = await executor.run_playbook(
                 playbook="01-kubespray.yml",
@@ -68,6 +83,74 @@ class TestAnsibleExecutor:
             call_args = mock_subprocess.call_args[0]
             assert "--extra-vars" in call_args
     
+    @pytest.mark.asyncio
+    async def test_run_playbook_enables_ssh_multiplexing(self, executor, inventory_file):
+        """Test playbook execution enables pipelining, ControlPersist and forks."""
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess:
+            mock_subprocess.return_value = _streaming_process(b"stdout", b"", 0)
+            
+            await executor.run_playbook(
+                playbook="01-kubespray.yml",
+                inventory=inventory_file,
+                forks=10
+            )
+            
+            call_args = mock_subprocess.call_args[0]
+            assert "-f" in call_args
+            assert call_args[call_args.index("-f") + 1] == "10"
+            env = mock_subprocess.call_args[1]["env"]
+            assert env["ANSIBLE_PIPELINING"] == "True"
+            assert "ControlPersist" in env["ANSIBLE_SSH_ARGS"]
+    
+    def test_ansible_env_enables_fact_cache(self, executor, temp_dir):
+        """Test the subprocess environment configures jsonfile fact caching."""
+        with patch.dict(os.environ, {}, clear=True):
+            env = executor._ansible_env()
+        
+        assert env["ANSIBLE_GATHERING"] == "smart"
+        assert env["ANSIBLE_CACHE_PLUGIN"] == "jsonfile"
+        assert env["ANSIBLE_CACHE_PLUGIN_CONNECTION"] == str(temp_dir / "factcache")
+        assert (temp_dir / "cp").is_dir()
+    
+    def test_ansible_env_no_cache(self, executor):
+        """Test no_cache leaves fact caching off."""
+        with patch.dict(os.environ, {}, clear=True):
+            env = executor._ansible_env(no_cache=True)
+        
+        assert "ANSIBLE_CACHE_PLUGIN" not in env
+    
+    @pytest.mark.asyncio
+    async def test_run_playbook_explicit_strategy(self, executor, inventory_file):
+        """Test an explicit strategy overrides the Mitogen default."""
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess:
+            mock_subprocess.return_value = _streaming_process(b"stdout", b"", 0)
+            
+            await executor.run_playbook(
+                playbook="01-kubespray.yml",
+                inventory=inventory_file,
+                strategy="linear"
+            )
+            
+            env = mock_subprocess.call_args[1]["env"]
+            assert env["ANSIBLE_STRATEGY"] == "linear"
+    
+    @pytest.mark.asyncio
+    async def test_run_playbook_mitogen_keeps_user_plugins(self, executor, inventory_file):
+        """Test the mitogen plugin dir is appended to a user-set strategy plugin path."""
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess, \
+                patch('cli.executors.ansible._mitogen_strategy_path', return_value="/mitogen"), \
+                patch.dict(os.environ, {"ANSIBLE_STRATEGY_PLUGINS": "/user/plugins"}):
+            mock_subprocess.return_value = _streaming_process(b"stdout", b"", 0)
+            
+            await executor.run_playbook(
+                playbook="01-kubespray.yml",
+                inventory=inventory_file
+            )
+            
+            env = mock_subprocess.call_args[1]["env"]
+            assert env["ANSIBLE_STRATEGY"] == "mitogen_linear"
+            assert env["ANSIBLE_STRATEGY_PLUGINS"] == os.pathsep.join(["/user/plugins", "/mitogen"])
+    
     @pytest.mark.asyncio
     async def test_run_ad_hoc_success(self, executor):
         """Test successful ad-hoc command execution."""
@@ -110,15 +193,26 @@ class TestAnsibleExecutor:
             result = executor.validate_playbook(str(playbook))
             assert result["valid"] is False
     
-    def test_list_playbooks(self, executor):
+    def test_list_playbooks(self, executor, temp_dir):
         """Test listing available playbooks."""
-        with patch('pathlib.Path.glob') as mock_glob:
-            mock_glob.return_value = [
-                Path("01-kubespray.yml"),
-                Path("03-gpu-operator.yml")
-            ]
-            
-            playbooks = executor.list_playbooks()
-            assert len(playbooks) == 2
-            assert "01-kubespray.yml" in playbooks
-
+        (temp_dir / "03-gpu-operator.yml").write_text("---\n")
+        (temp_dir / "01-kubespray.yml").write_text("---\n")
+        (temp_dir / "README.md").write_text("not a playbook\n")
+        executor.playbooks_dir = temp_dir
+        
+        playbooks = executor.list_playbooks()
+        assert playbooks == ["01-kubespray.yml", "03-gpu-operator.yml"]
+    
+    def test_list_playbooks_cached_until_dir_changes(self, executor, temp_dir):
+        """Test playbook listing is reused until the directory changes."""
+        (temp_dir / "01-kubespray.yml").write_text("---\n")
+        executor.playbooks_dir = temp_dir
+        assert executor.list_playbooks() == ["01-kubespray.yml"]
+        
+        with patch('os.scandir') as mock_scandir:
+            assert executor.list_playbooks() == ["01-kubespray.yml"]
+            mock_scandir.assert_not_called()
+        
+        (temp_dir / "05-validate.yml").write_text("---\n")
+        os.utime(temp_dir, ns=(0, temp_dir.stat().st_mtime_ns + 1_000_000))
+        assert executor.list_playbooks() == ["01-kubespray.yml", "05-validate.yml"]
@@ -0,0 +1,29 @@
+"""Tests for streamed subprocess output."""
+
+import sys
+import pytest
+from cli.executors._stream import STREAM_LIMIT, run_streaming
+
+
+class TestRunStreaming:
+    """Test run_streaming function."""
+
+    @pytest.mark.asyncio
+    async def test_long_line(self):
+        """Test a line longer than the read buffer comes back whole."""
+        length = STREAM_LIMIT * 2 + 7
+        script = f"import sys; sys.stdout.write('a\\n' + 'x' * {length} + '\\nb')"
+
+        returncode, stdout, _ = await run_streaming([sys.executable, "-c", script], max_lines=None)
+
+        assert returncode == 0
+        assert [len(line) for line in stdout.split("\n")] == [1, length, 1]
+
+    @pytest.mark.asyncio
+    async def test_max_lines(self):
+        """Test only the last max_lines lines are kept."""
+        script = "for i in range(10): print(i)"
+
+        _, stdout, _ = await run_streaming([sys.executable, "-c", script], max_lines=3)
+
+        assert stdout == "7\n8\n9\n"
@@ -0,0 +1,29 @@
+"""Tests for the top-level CLI app."""
+
+import pytest
+from typer.testing import CliRunner
+from cli.main import COMMAND_GROUPS, app
+
+
+runner = CliRunner()
+
+
+class TestMain:
+    """Test the lazily loaded command groups."""
+
+    def test_root_help_lists_groups(self):
+        """Test --help lists every command group."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in COMMAND_GROUPS:
+            assert name in result.output
+
+    @pytest.mark.parametrize("group", list(COMMAND_GROUPS))
+    def test_group_help(self, group):
+        """Test <group> --help works and has no completion options."""
+        result = runner.invoke(app, [group, "--help"])
+
+        assert result.exit_code == 0
+        assert "--install-completion" not in result.output
+        assert "--show-completion" not in result.output
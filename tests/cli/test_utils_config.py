@@ -3,6 +3,7 @@
 import pytest
 import yaml
 from pathlib import Path
+from unittest.mock import patch
 from cli.utils.config import ConfigManager
 
 
@@ -26,6 +27,23 @@ class TestConfigManager:
         
         assert config["blueprint_version"] == sample_config["blueprint_version"]
     
+    def test_load_reuses_parse_until_file_changes(self, temp_dir, sample_config):
+        """Test repeated loads are cached and invalidated when the file changes."""
+        config_file = temp_dir / "cached-config.yaml"
+        manager = ConfigManager(config_file)
+        manager.save(sample_config)
+        
+        with patch('cli.utils.config.yaml.load', wraps=yaml.load) as mock_load:
+            first = manager.load()
+            first["gpu_count"] = 99
+            second = manager.load()
+            assert mock_load.call_count == 1
+            assert second["gpu_count"] == sample_config["gpu_count"]
+            
+            manager.save({**sample_config, "gpu_count": 4})
+            assert manager.load()["gpu_count"] == 4
+            assert mock_load.call_count == 2
+    
     def test_save_config(self, temp_dir, sample_config):
         """Test saving configuration."""
         config_file = temp_dir / "test-config.yaml"
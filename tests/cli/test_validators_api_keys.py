@@ -1,5 +1,6 @@
 """Tests for API key validator."""
 
+import asyncio
 import pytest
 from unittest.mock import patch, Mock
 from cli.validators.api_keys import APIKeyValidator
@@ -39,7 +40,7 @@ class TestAPIKeyValidator:
         validator = APIKeyValidator()
         assert not validator.validate_format("anthropic", "invalid-key")
     
-    @patch('requests.get')
+    @patch('cli.validators.api_keys._SESSION.get')
     def test_test_key_nvidia_pass(self, mock_get):
         """Test NVIDIA API key test passes."""
         mock_get.return_value = Mock(status_code=200)
@@ -50,7 +51,7 @@ class TestAPIKeyValidator:
         assert result is True
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('cli.validators.api_keys._SESSION.get')
     def test_test_key_nvidia_fail(self, mock_get):
         """Test NVIDIA API key test fails."""
         mock_get.side_effect = Exception("Connection error")
@@ -60,7 +61,7 @@ class TestAPIKeyValidator:
         
         assert result is False
     
-    @patch('requests.get')
+    @patch('cli.validators.api_keys._SESSION.get')
     def test_test_key_openai_pass(self, mock_get):
         """Test OpenAI API key test passes."""
         mock_get.return_value = Mock(status_code=200)
@@ -70,7 +71,7 @@ class TestAPIKeyValidator:
         
         assert result is True
     
-    @patch('requests.get')
+    @patch('cli.validators.api_keys._SESSION.get')
     def test_test_key_openai_fail(self, mock_get):
         """Test OpenAI API key test fails."""
         mock_get.return_value = Mock(status_code=401)
@@ -80,7 +81,7 @@ class TestAPIKeyValidator:
         
         assert result is False
     
-    @patch('requests.get')
+    @patch('cli.validators.api_keys._SESSION.get')
     def test_test_key_anthropic_pass(self, mock_get):
         """Test Anthropic API key test passes."""
         mock_get.return_value = Mock(status_code=400)  # 400 is expected for GET
@@ -89,4 +90,20 @@ class TestAPIKeyValidator:
         result = validator.test_key("anthropic", "sk-ant-test-key")
         
         assert result is True
-
+    
+    @patch('cli.validators.api_keys.HTTPX_AVAILABLE', False)
+    @patch('cli.validators.api_keys._SESSION.get')
+    def test_test_keys_concurrent(self, mock_get):
+        """Test several API keys are tested together and reported per type."""
+        mock_get.side_effect = lambda url, **kwargs: Mock(
+            status_code=200 if "openai" in url else 403
+        )
+        
+        validator = APIKeyValidator()
+        results = asyncio.run(validator.test_keys({
+            "openai": "sk-test-key",
+            "anthropic": "sk-ant-test-key"
+        }))
+        
+        assert results == {"openai": True, "anthropic": False}
+        assert mock_get.call_count == 2
@@ -0,0 +1,115 @@
+"""Tests for hardware validator."""
+
+import subprocess
+import pytest
+from unittest.mock import patch
+from cli.validators.hardware import HardwareValidator, NODE_PROBES
+
+
+def _run_locally(node, command, connect_timeout=10, timeout=30):
+    """Stand-in for SSHRunner.run that executes the script in a local shell."""
+    return subprocess.run(["sh", "-c", command], capture_output=True, timeout=timeout)
+
+
+@pytest.fixture
+def node(mock_ssh_key):
+    """A worker node whose SSH key exists."""
+    return {
+        "hostname": "worker1",
+        "ip": "192.168.1.11",
+        "user": "ubuntu",
+        "ssh_key": mock_ssh_key,
+        "ssh_key_ok": True,
+        "is_master": False,
+        "has_gpu": False
+    }
+
+
+class TestHardwareValidator:
+    """Test HardwareValidator class."""
+
+    @pytest.fixture
+    def validator(self, inventory_file, inventory_cache):
+        """Create HardwareValidator instance."""
+        return HardwareValidator(inventory_file)
+
+    def test_run_probes_splits_output(self, validator, node):
+        """Test batched probes are split back into one result per probe."""
+        probes = {"one": "echo 1", "multi": "printf 'a\\nb'", "bad": "(echo oops; exit 3)"}
+
+        with patch.object(validator._ssh, "run", side_effect=_run_locally) as mock_run:
+            outputs = validator._run_probes(node, probes)
+
+        assert mock_run.call_count == 1
+        assert outputs["one"]["success"] is True
+        assert outputs["one"]["stdout"].strip() == b"1"
+        assert outputs["multi"]["stdout"].strip() == b"a\nb"
+        assert outputs["bad"]["success"] is False
+        assert outputs["bad"]["returncode"] == 3
+        assert outputs["bad"]["stdout"].strip() == b"oops"
+
+    def test_run_probes_missing_marker(self, validator, node):
+        """Test probes cut off by an early exit are reported as failures."""
+        probes = {"first": "echo 1", "second": "exit 0", "third": "echo 3"}
+
+        with patch.object(validator._ssh, "run", side_effect=_run_locally):
+            outputs = validator._run_probes(node, probes)
+
+        assert outputs["first"]["success"] is True
+        assert outputs["second"]["success"] is False
+        assert outputs["third"]["error"] == "No output from probe"
+
+    def test_run_probes_ssh_failure(self, validator, node):
+        """Test an SSH failure is reported for every probe."""
+        node["ssh_key_ok"] = False
+
+        outputs = validator._run_probes(node, NODE_PROBES)
+
+        assert set(outputs) == set(NODE_PROBES)
+        assert all("SSH key not found" in result["error"] for result in outputs.values())
+
+    def test_validate_node(self, validator, node):
+        """Test node checks are built from the batched probe output."""
+        probes = {
+            "cpu": "echo 4",
+            "ram": "echo 32768",
+            "storage": "echo 107374182400",
+        }
+
+        with patch("cli.validators.hardware.NODE_PROBES", probes), \
+                patch.object(validator._ssh, "run", side_effect=_run_locally):
+            results = validator._validate_node(node)
+
+        statuses = {result["name"]: result["status"] for result in results}
+        assert statuses == {
+            "worker1 - CPU": "warn",
+            "worker1 - RAM": "pass",
+            "worker1 - Storage": "pass"
+        }
+
+    def test_check_gpu_ssh_failure(self, validator, node):
+        """Test a failed SSH call is reported as such, not as a GPU problem."""
+        result = {"success": False, "stdout": b"", "stderr": b"Connection refused", "returncode": 255}
+
+        check = validator._check_gpu(node, result)
+
+        assert "SSH failed" in check["message"]
+        assert "GPU detected" not in check["message"]
+
+    def test_check_gpu_details_failure(self, validator, node):
+        """Test a failing nvidia-smi on a reachable node is a GPU problem."""
+        result = {"success": False, "stdout": b"", "returncode": 9}
+
+        check = validator._check_gpu(node, result)
+
+        assert check["message"] == "GPU detected but could not get details"
+
+    def test_validate_all_no_nodes(self, temp_dir, inventory_cache):
+        """Test validation fails when the inventory has no nodes."""
+        inv_file = temp_dir / "empty.yml"
+        inv_file.write_text("all: {}\n")
+
+        results = HardwareValidator(str(inv_file)).validate_all()
+
+        assert len(results) == 1
+        assert results[0]["status"] == "fail"
@@ -0,0 +1,80 @@
+"""Tests for validator inventory loading."""
+
+import os
+import pytest
+import yaml
+from unittest.mock import patch
+from cli.validators import _inventory
+from cli.validators._inventory import get_nodes, load_inventory
+
+
+pytestmark = pytest.mark.usefixtures("inventory_cache")
+
+
+class TestLoadInventory:
+    """Test load_inventory function."""
+
+    def test_load_missing_file(self, temp_dir):
+        """Test a missing inventory loads as empty."""
+        assert load_inventory(temp_dir / "missing.yml") == {}
+
+    def test_load_writes_cache(self, inventory_file, sample_inventory, inventory_cache):
+        """Test the parsed inventory is pickled to the cache dir."""
+        inventory = load_inventory(inventory_file)
+
+        assert inventory == sample_inventory
+        assert len(list(inventory_cache.glob("inventory-*.pickle"))) == 1
+
+    def test_load_reuses_cache(self, inventory_file, sample_inventory):
+        """Test an unchanged inventory is read from the cache without parsing."""
+        load_inventory(inventory_file)
+        _inventory._load_cached.cache_clear()
+
+        with patch("cli.validators._inventory.yaml.load") as mock_load:
+            inventory = load_inventory(inventory_file)
+
+        mock_load.assert_not_called()
+        assert inventory == sample_inventory
+
+    def test_load_reparses_changed_file(self, inventory_file, sample_inventory):
+        """Test an edited inventory is parsed again."""
+        load_inventory(inventory_file)
+
+        sample_inventory["all"]["children"]["kube_node"]["hosts"]["worker2"] = {"ansible_host": "192.168.1.12"}
+        with open(inventory_file, "w") as f:
+            yaml.dump(sample_inventory, f)
+        st = os.stat(inventory_file)
+        os.utime(inventory_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        inventory = load_inventory(inventory_file)
+
+        assert "worker2" in inventory["all"]["children"]["kube_node"]["hosts"]
+
+
+class TestGetNodes:
+    """Test get_nodes function."""
+
+    def test_get_nodes(self, sample_inventory):
+        """Test nodes are extracted from both groups."""
+        nodes = get_nodes(sample_inventory)
+
+        assert [node["hostname"] for node in nodes] == ["master1", "worker1"]
+        assert nodes[0]["is_master"] is True
+        assert nodes[1]["has_gpu"] is True
+        assert nodes[0]["ssh_key"] == os.path.expanduser("~/.ssh/id_rsa")
+
+    def test_get_nodes_key_present(self, sample_inventory, mock_ssh_key):
+        """Test ssh_key_ok reflects whether the key file exists."""
+        hosts = sample_inventory["all"]["children"]["kube_control_plane"]["hosts"]
+        hosts["master1"]["ansible_ssh_private_key_file"] = mock_ssh_key
+        hosts = sample_inventory["all"]["children"]["kube_node"]["hosts"]
+        hosts["worker1"]["ansible_ssh_private_key_file"] = mock_ssh_key + ".missing"
+
+        nodes = get_nodes(sample_inventory)
+
+        assert nodes[0]["ssh_key_ok"] is True
+        assert nodes[1]["ssh_key_ok"] is False
+
+    def test_get_nodes_empty(self):
+        """Test an empty inventory has no nodes."""
+        assert get_nodes({}) == []
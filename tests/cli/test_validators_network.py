@@ -0,0 +1,102 @@
+"""Tests for network validator."""
+
+import socket
+import subprocess
+import pytest
+from unittest.mock import patch
+from cli.validators.network import NetworkValidator
+
+
+@pytest.fixture
+def listening_port():
+    """A localhost port with a listening socket."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+@pytest.fixture
+def closed_port():
+    """A localhost port with nothing listening on it."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestNetworkValidator:
+    """Test NetworkValidator class."""
+
+    @pytest.fixture
+    def validator(self, inventory_file, inventory_cache):
+        """Create NetworkValidator instance."""
+        return NetworkValidator(inventory_file)
+
+    def test_probe_ports(self, validator, listening_port, closed_port):
+        """Test open and closed ports are told apart in one batch."""
+        results = validator._probe_ports(
+            [("127.0.0.1", listening_port), ("127.0.0.1", closed_port)], timeout=2
+        )
+
+        assert results[("127.0.0.1", listening_port)]["status"] == "pass"
+        assert results[("127.0.0.1", closed_port)]["status"] == "warn"
+
+    def test_probe_ports_duplicates(self, validator, listening_port):
+        """Test a repeated target is probed once."""
+        target = ("127.0.0.1", listening_port)
+
+        results = validator._probe_ports([target, target], timeout=2)
+
+        assert list(results) == [target]
+
+    def test_test_port(self, validator, listening_port):
+        """Test single-port check passes for a listening socket."""
+        result = validator._test_port("127.0.0.1", listening_port)
+
+        assert result["status"] == "pass"
+        assert str(listening_port) in result["message"]
+
+    def test_test_reach_pass(self, validator, mock_ssh_key):
+        """Test reachability passes when the remote probe succeeds."""
+        node = {"ip": "192.168.1.10", "user": "ubuntu", "ssh_key": mock_ssh_key, "ssh_key_ok": True}
+
+        with patch.object(validator._ssh, "run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, b"", b"")
+            result = validator._test_reach(node, {"ip": "192.168.1.11"})
+
+        assert result["status"] == "pass"
+        command = mock_run.call_args[0][1]
+        assert "nc -z -w 2 192.168.1.11 22" in command
+        assert "/dev/tcp/192.168.1.11/22" in command
+
+    def test_test_reach_no_tool(self, validator, mock_ssh_key):
+        """Test a node with neither nc nor bash gets a warning, not a failure."""
+        node = {"ip": "192.168.1.10", "user": "ubuntu", "ssh_key": mock_ssh_key, "ssh_key_ok": True}
+
+        with patch.object(validator._ssh, "run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 127, b"", b"")
+            result = validator._test_reach(node, {"ip": "192.168.1.11"})
+
+        assert result["status"] == "warn"
+
+    def test_test_reach_ssh_failure(self, validator, mock_ssh_key):
+        """Test an SSH failure is blamed on the source node, not the target."""
+        node = {"ip": "192.168.1.10", "user": "ubuntu", "ssh_key": mock_ssh_key, "ssh_key_ok": True}
+
+        with patch.object(validator._ssh, "run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 255, b"", b"Connection refused")
+            result = validator._test_reach(node, {"ip": "192.168.1.11"})
+
+        assert result["status"] == "fail"
+        assert "SSH to 192.168.1.10 failed" in result["message"]
+        assert "192.168.1.11" not in result["message"]
+
+    def test_test_reach_missing_key(self, validator):
+        """Test reachability fails without an SSH key."""
+        node = {"ip": "192.168.1.10", "ssh_key_ok": False}
+
+        with patch.object(validator._ssh, "run") as mock_run:
+            result = validator._test_reach(node, {"ip": "192.168.1.11"})
+
+        assert result["status"] == "fail"
+        mock_run.assert_not_called()
@@ -0,0 +1,124 @@
+"""Tests for validator SSH helpers."""
+
+import socket
+import subprocess
+import pytest
+from unittest.mock import patch, MagicMock
+from cli.validators import _ssh
+from cli.validators._ssh import SSHClientPool, SSHRunner, get_runner
+
+
+@pytest.fixture
+def node(mock_ssh_key):
+    """A node whose SSH key exists."""
+    return {"ip": "192.168.1.10", "user": "ubuntu", "ssh_key": mock_ssh_key}
+
+
+@pytest.fixture
+def mock_paramiko():
+    """Stand in for paramiko, which is optional."""
+    with patch.object(_ssh, "paramiko", MagicMock(), create=True) as paramiko:
+        client = paramiko.SSHClient.return_value
+        client.get_transport.return_value.is_active.return_value = True
+        stdout, stderr = MagicMock(), MagicMock()
+        stdout.read.return_value = b"out"
+        stdout.channel.recv_exit_status.return_value = 0
+        stderr.read.return_value = b""
+        client.exec_command.return_value = (MagicMock(), stdout, stderr)
+        yield paramiko
+
+
+class TestSSHClientPool:
+    """Test SSHClientPool class."""
+
+    def test_run(self, mock_paramiko):
+        """Test a command's output and exit status are returned like subprocess.run."""
+        pool = SSHClientPool()
+
+        result = pool.run("192.168.1.10", "ubuntu", "/key", "uptime", timeout=5)
+
+        assert result.returncode == 0
+        assert result.stdout == b"out"
+        mock_paramiko.SSHClient.return_value.exec_command.assert_called_once_with("uptime", timeout=5)
+
+    def test_run_reuses_connection(self, mock_paramiko):
+        """Test repeat commands to a host share one connection."""
+        pool = SSHClientPool()
+
+        pool.run("192.168.1.10", "ubuntu", "/key", "uptime")
+        pool.run("192.168.1.10", "ubuntu", "/key", "nproc")
+
+        assert mock_paramiko.SSHClient.call_count == 1
+        assert mock_paramiko.SSHClient.return_value.connect.call_count == 1
+
+    def test_run_reconnects_inactive(self, mock_paramiko):
+        """Test a dropped transport is replaced with a new connection."""
+        pool = SSHClientPool()
+        pool.run("192.168.1.10", "ubuntu", "/key", "uptime")
+        mock_paramiko.SSHClient.return_value.get_transport.return_value.is_active.return_value = False
+
+        pool.run("192.168.1.10", "ubuntu", "/key", "uptime")
+
+        assert mock_paramiko.SSHClient.return_value.connect.call_count == 2
+
+    def test_run_connect_failure(self, mock_paramiko):
+        """Test a failed connect is reported as exit status 255."""
+        mock_paramiko.SSHClient.return_value.connect.side_effect = OSError("refused")
+        pool = SSHClientPool()
+
+        result = pool.run("192.168.1.10", "ubuntu", "/key", "uptime")
+
+        assert result.returncode == 255
+        assert b"refused" in result.stderr
+
+    def test_run_timeout(self, mock_paramiko):
+        """Test a command that outlives its timeout raises TimeoutExpired."""
+        stdout = mock_paramiko.SSHClient.return_value.exec_command.return_value[1]
+        stdout.read.side_effect = socket.timeout
+        pool = SSHClientPool()
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.run("192.168.1.10", "ubuntu", "/key", "sleep 60", timeout=1)
+
+    def test_close(self, mock_paramiko):
+        """Test close closes every pooled client."""
+        pool = SSHClientPool()
+        pool.run("192.168.1.10", "ubuntu", "/key", "uptime")
+
+        pool.close()
+
+        mock_paramiko.SSHClient.return_value.close.assert_called_once()
+
+
+class TestSSHRunner:
+    """Test SSHRunner class."""
+
+    @patch.object(_ssh, "PARAMIKO_AVAILABLE", False)
+    @patch("subprocess.run")
+    def test_run_without_paramiko(self, mock_run, node):
+        """Test the ssh client is used, multiplexed, when paramiko is missing."""
+        mock_run.return_value = subprocess.CompletedProcess([], 0, b"", b"")
+        runner = SSHRunner()
+
+        runner.run(node, "uptime", connect_timeout=5, timeout=10)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[0] == "ssh"
+        assert cmd[-2:] == ["ubuntu@192.168.1.10", "uptime"]
+        assert "ConnectTimeout=5" in cmd
+        assert any(arg.startswith(f"ControlPath={runner._control_dir}") for arg in cmd)
+        assert mock_run.call_args[1]["timeout"] == 10
+
+    @patch.object(_ssh, "PARAMIKO_AVAILABLE", True)
+    def test_run_with_paramiko(self, mock_paramiko, node):
+        """Test the connection pool is used when paramiko is installed."""
+        runner = SSHRunner()
+
+        result = runner.run(node, "uptime")
+
+        assert result.stdout == b"out"
+        mock_paramiko.SSHClient.return_value.connect.assert_called_once()
+
+    def test_get_runner_shared(self):
+        """Test every caller gets the same runner, and so one session cap."""
+        assert get_runner() is get_runner()
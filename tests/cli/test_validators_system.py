@@ -2,9 +2,18 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
+from cli.validators import system
 from cli.validators.system import SystemValidator
 
 
+@pytest.fixture(autouse=True)
+def clear_which_cache():
+    """Reset memoized PATH lookups so each test sees its own shutil.which."""
+    system._which.cache_clear()
+    yield
+    system._which.cache_clear()
+
+
 class TestSystemValidator:
     """Test SystemValidator class."""
     
@@ -43,11 +52,9 @@ class TestSystemValidator:
         assert result["status"] == "fail"
         assert "not found" in result["message"].lower()
     
-    @patch('pathlib.Path.exists')
     @patch('pathlib.Path.stat')
-    def test_check_ssh_key_pass(self, mock_stat, mock_exists):
+    def test_check_ssh_key_pass(self, mock_stat):
         """Test SSH key check passes when key exists with correct permissions."""
-        mock_exists.return_value = True
         mock_stat.return_value = MagicMock(st_mode=0o600)
         
         validator = SystemValidator()
@@ -56,10 +63,21 @@ class TestSystemValidator:
         assert result["status"] == "pass"
         assert "SSH key found" in result["message"]
     
-    @patch('pathlib.Path.exists')
-    def test_check_ssh_key_fail(self, mock_exists):
+    @patch('pathlib.Path.stat')
+    def test_check_ssh_key_open_permissions(self, mock_stat):
+        """Test SSH key check warns when the key is readable by others."""
+        mock_stat.return_value = MagicMock(st_mode=0o644)
+        
+        validator = SystemValidator()
+        result = validator.check_ssh_key()
+        
+        assert result["status"] == "warn"
+        assert "too open" in result["message"]
+    
+    @patch('pathlib.Path.stat')
+    def test_check_ssh_key_fail(self, mock_stat):
         """Test SSH key check fails when key doesn't exist."""
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError
         
         validator = SystemValidator()
         result = validator.check_ssh_key()
@@ -93,6 +111,17 @@ class TestSystemValidator:
         
         assert result["status"] == "fail"
     
+    @patch('shutil.which')
+    def test_which_memoized(self, mock_which):
+        """Test repeated checks look a tool up on PATH only once."""
+        mock_which.return_value = None
+        
+        validator = SystemValidator()
+        validator.check_git()
+        SystemValidator().check_git()
+        
+        mock_which.assert_called_once_with("git")
+    
     def test_validate_all(self):
         """Test validate_all returns list of results."""
         validator = SystemValidator()
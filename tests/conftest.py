@@ -57,6 +57,18 @@ def inventory_file(temp_dir, sample_inventory):
     return str(inv_file)
 
 
+@pytest.fixture
+def inventory_cache(temp_dir, monkeypatch):
+    """Point the validators' parsed-inventory cache at a temp dir, starting cold."""
+    from cli.validators import _inventory
+    
+    cache_dir = temp_dir / "cache"
+    monkeypatch.setattr(_inventory, "CACHE_DIR", cache_dir)
+    _inventory._load_cached.cache_clear()
+    yield cache_dir
+    _inventory._load_cached.cache_clear()
+
+
 @pytest.fixture
 def sample_config():
     """Sample configuration for testing."""